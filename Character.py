@@ -1,6 +1,8 @@
 from location import Location
+from maze import WALK, IGNORE_WALLS, DOUBLE_STEP
 
 import pathfinding
+from distance_table import get_distance_table
 
 
 class Character:
@@ -45,32 +47,59 @@ class MasterYoda(GoodCharacter):
 
 
 class EnemyCharacter(Character):
+    movement_rule = None
+    search_algorithm = "bfs"
+
     def __init__(self, name, location):
         super().__init__(name, "Kötü", location)
+        self.incremental_search = None
+
+    def get_incremental_search(self, maze):
+        if self.incremental_search is None or self.incremental_search.maze is not maze:
+            self.incremental_search = pathfinding.IncrementalSearch(maze, self.movement_rule)
+        return self.incremental_search
 
     def find_shortest_path(self, maze, target_location):
-        pass
+        if self.search_algorithm == "bfs":
+            return get_distance_table(maze, self.movement_rule).path(self.location, target_location)
+        if self.search_algorithm == "incremental":
+            return self.get_incremental_search(maze).find_path(self.location, target_location)
+        return pathfinding.find_path(maze, self.location, target_location, self.movement_rule, self.search_algorithm)
+
+    def next_step(self, maze, target_location):
+        if self.search_algorithm == "bfs":
+            return get_distance_table(maze, self.movement_rule).next_step(self.location, target_location)
+        if self.search_algorithm == "incremental":
+            return self.get_incremental_search(maze).next_step(self.location, target_location)
+
+        path = self.find_shortest_path(maze, target_location)
+        if path and len(path) > 1:
+            return path[1]
+        return None
 
 
 class Stormtrooper(EnemyCharacter):
+    movement_rule = WALK
+
     def __init__(self, location):
         super().__init__("Stormtrooper", location)
 
-    def find_shortest_path(self, maze, target_location):
-        return pathfinding.bfs(maze, self.location, target_location)
-
 
 class DarthVader(EnemyCharacter):
+    movement_rule = IGNORE_WALLS
+
     def __init__(self, location):
         super().__init__("Darth Vader", location)
 
     def find_shortest_path(self, maze, target_location):
-        return pathfinding.bfs_ignore_walls(maze, self.location, target_location)
+        return pathfinding.manhattan_path(maze, self.location, target_location)
+
+    def next_step(self, maze, target_location):
+        return pathfinding.manhattan_next_step(maze, self.location, target_location)
 
 
 class KyloRen(EnemyCharacter):
-    def __init__(self, location):
-        super().__init__("Kylo Ren", location)
+    movement_rule = DOUBLE_STEP
 
-    def find_shortest_path(self, maze, target_location):
-        return pathfinding.bfs_double_step(maze, self.location, target_location)
\ No newline at end of file
+    def __init__(self, location):
+        super().__init__("Kylo Ren", location)
\ No newline at end of file
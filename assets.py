@@ -0,0 +1,93 @@
+from collections import OrderedDict
+
+import pygame
+
+
+MAX_TEXT_SURFACES = 256
+
+images = {}
+scaled_images = {}
+sounds = {}
+fonts = {}
+text_surfaces = OrderedDict()
+missing = set()
+
+
+def load_image(path):
+    if path in images:
+        return images[path]
+    if path in missing:
+        return None
+
+    try:
+        image = pygame.image.load(path)
+    except (pygame.error, FileNotFoundError):
+        print(f"Could not load image: {path}")
+        missing.add(path)
+        return None
+
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha()
+        images[path] = image
+    return image
+
+
+def get_scaled_image(path, size):
+    key = (path, size)
+    if key in scaled_images:
+        return scaled_images[key]
+
+    image = load_image(path)
+    if image is None:
+        return None
+
+    scaled = pygame.transform.scale(image, size)
+    if path in images:
+        scaled_images[key] = scaled
+    return scaled
+
+
+def get_sound(path):
+    if path in sounds:
+        return sounds[path]
+    if path in missing:
+        return None
+
+    try:
+        sound = pygame.mixer.Sound(path)
+    except (pygame.error, FileNotFoundError):
+        print(f"Could not load sound: {path}")
+        missing.add(path)
+        return None
+
+    sounds[path] = sound
+    return sound
+
+
+def get_font(name, size):
+    key = (name, size)
+    if key not in fonts:
+        fonts[key] = pygame.font.SysFont(name, size)
+    return fonts[key]
+
+
+def render_text(font, text, color):
+    key = (font, text, tuple(color))
+    surface = text_surfaces.get(key)
+    if surface is not None:
+        text_surfaces.move_to_end(key)
+        return surface
+
+    surface = font.render(text, True, color)
+    text_surfaces[key] = surface
+    if len(text_surfaces) > MAX_TEXT_SURFACES:
+        text_surfaces.popitem(last=False)
+    return surface
+
+
+def play_music(path, loops=-1):
+    try:
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.play(loops)
+    except (pygame.error, FileNotFoundError):
+        print(f"Could not stream music: {path}")
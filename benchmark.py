@@ -0,0 +1,239 @@
+import argparse
+from functools import partial
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import pathfinding
+from maze import Maze, WALK, IGNORE_WALLS, DOUBLE_STEP
+from maze_generator import generate_map
+
+
+SIZES = [(14, 11), (50, 50), (100, 100), (250, 250), (500, 500), (1000, 1000), (2000, 2000)]
+
+DENSITIES = {
+    "open": 0.0,
+    "sparse": 0.15,
+    "dense": 0.3,
+    "braided": "braided",
+    "labyrinth": "perfect"
+}
+
+SEARCHES = {
+    "bfs": (pathfinding.bfs, WALK),
+    "bfs_double_step": (pathfinding.bfs_double_step, DOUBLE_STEP),
+    "bfs_ignore_walls": (pathfinding.bfs_ignore_walls, IGNORE_WALLS),
+    "astar": (partial(pathfinding.astar, rule=WALK), WALK),
+    "astar_double_step": (partial(pathfinding.astar, rule=DOUBLE_STEP), DOUBLE_STEP),
+    "bidirectional": (partial(pathfinding.bidirectional_bfs, rule=WALK), WALK),
+    "bidirectional_double_step": (partial(pathfinding.bidirectional_bfs, rule=DOUBLE_STEP), DOUBLE_STEP),
+    "bitboard": (partial(pathfinding.bitboard_bfs, rule=WALK), WALK),
+    "bitboard_double_step": (partial(pathfinding.bitboard_bfs, rule=DOUBLE_STEP), DOUBLE_STEP),
+    "bitboard_ignore_walls": (partial(pathfinding.bitboard_bfs, rule=IGNORE_WALLS), IGNORE_WALLS)
+}
+
+REFERENCE_SEARCHES = {
+    WALK: pathfinding.bfs,
+    DOUBLE_STEP: pathfinding.bfs_double_step,
+    IGNORE_WALLS: pathfinding.bfs_ignore_walls
+}
+
+
+def random_grid(width, height, wall_density, rng):
+    return [[0 if rng.random() < wall_density else 1 for _ in range(width)] for _ in range(height)]
+
+
+def build_maze(width, height, density, seed):
+    setting = DENSITIES[density]
+
+    if isinstance(setting, str):
+        return generate_map(width, height, setting, seed).to_maze()
+
+    return Maze(random_grid(width, height, setting, random.Random(seed)))
+
+
+def pick_endpoints(maze):
+    start = next(cell for cell in range(maze.size) if maze.grid[cell])
+    distances = pathfinding.distance_field(maze, maze.cell_location(start), WALK)
+    target = max(range(maze.size), key=distances.__getitem__)
+    return maze.cell_location(start), maze.cell_location(target)
+
+
+def measure(search, maze, start_location, target_location, repeats):
+    best = None
+    for _ in range(repeats):
+        pathfinding.reset_search_stats()
+        start_time = time.perf_counter()
+        path = search(maze, start_location, target_location)
+        elapsed = time.perf_counter() - start_time
+        best = elapsed if best is None else min(best, elapsed)
+
+    expanded = pathfinding.search_stats["expanded"]
+
+    tracemalloc.start()
+    search(maze, start_location, target_location)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": best,
+        "peak_bytes": peak_memory,
+        "expanded": expanded,
+        "path_length": len(path) - 1 if path else None
+    }
+
+
+def run_benchmarks(sizes, densities, searches, repeats, seed):
+    results = []
+
+    for width, height in sizes:
+        for density in densities:
+            maze = build_maze(width, height, density, seed)
+            start_location, target_location = pick_endpoints(maze)
+            reference_lengths = {}
+
+            for name in searches:
+                search, rule = SEARCHES[name]
+
+                compile_start = time.perf_counter()
+                maze.get_rule_tables(rule)
+                compile_seconds = time.perf_counter() - compile_start
+
+                result = measure(search, maze, start_location, target_location, repeats)
+
+                if rule not in reference_lengths:
+                    reference_path = REFERENCE_SEARCHES[rule](maze, start_location, target_location)
+                    reference_lengths[rule] = len(reference_path) - 1 if reference_path else None
+
+                result.update({
+                    "search": name,
+                    "width": width,
+                    "height": height,
+                    "density": density,
+                    "compile_seconds": compile_seconds,
+                    "matches_bfs": result["path_length"] == reference_lengths[rule]
+                })
+                results.append(result)
+
+                print(f"{name:26} {width:>5}x{height:<5} {density:10} "
+                      f"{result['seconds'] * 1000:10.2f} ms {result['peak_bytes'] / 1024:10.0f} KiB "
+                      f"{result['expanded']:>9} düğüm"
+                      f"{'' if result['matches_bfs'] else '  UYUMSUZ: BFS ile farklı uzunluk'}")
+
+    return results
+
+
+def run_chase(maze, rule, turns, seed):
+    rng = random.Random(seed)
+    start_location, player_location = pick_endpoints(maze)
+    enemy_location = start_location
+    incremental_search = pathfinding.IncrementalSearch(maze, rule)
+    totals = {"incremental": [0, 0.0], "bfs": [0, 0.0]}
+
+    for _ in range(turns):
+        moves = maze.get_move_neighbors(player_location, WALK)
+        if moves:
+            player_location = rng.choice(moves)
+
+        pathfinding.reset_search_stats()
+        start_time = time.perf_counter()
+        next_location = incremental_search.next_step(enemy_location, player_location)
+        totals["incremental"][1] += time.perf_counter() - start_time
+        totals["incremental"][0] += pathfinding.search_stats["expanded"]
+
+        pathfinding.reset_search_stats()
+        start_time = time.perf_counter()
+        field = pathfinding.distance_field(maze, player_location, rule)
+        pathfinding.next_step_from_field(maze, field, enemy_location, rule)
+        totals["bfs"][1] += time.perf_counter() - start_time
+        totals["bfs"][0] += pathfinding.search_stats["expanded"]
+
+        if next_location is not None:
+            enemy_location = next_location
+        if enemy_location == player_location:
+            enemy_location = start_location
+
+    return totals
+
+
+def run_chase_benchmarks(sizes, densities, turns, seed):
+    results = []
+
+    for width, height in sizes:
+        for density in densities:
+            maze = build_maze(width, height, density, seed)
+
+            for rule in (WALK, DOUBLE_STEP):
+                totals = run_chase(maze, rule, turns, seed)
+                for mode, (expanded, seconds) in totals.items():
+                    results.append({
+                        "mode": mode,
+                        "rule": rule,
+                        "width": width,
+                        "height": height,
+                        "density": density,
+                        "turns": turns,
+                        "expanded_per_turn": expanded / turns,
+                        "seconds_per_turn": seconds / turns
+                    })
+
+                print(f"kovalama {rule:12} {width:>5}x{height:<5} {density:10} "
+                      f"artımlı {totals['incremental'][0] / turns:10.0f} düğüm/tur "
+                      f"{totals['incremental'][1] * 1000 / turns:8.2f} ms | "
+                      f"bfs {totals['bfs'][0] / turns:10.0f} düğüm/tur {totals['bfs'][1] * 1000 / turns:8.2f} ms")
+
+    return results
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"en az 1 olmalı: {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pathfinding aramalarını büyüyen haritalarda ölçer")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=SIZES)
+    parser.add_argument("--densities", nargs="+", choices=list(DENSITIES), default=list(DENSITIES))
+    parser.add_argument("--searches", nargs="+", choices=list(SEARCHES), default=list(SEARCHES))
+    parser.add_argument("--repeats", type=positive_int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chase-turns", type=int, default=0)
+    parser.add_argument("--label", default="")
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.sizes, args.densities, args.searches, args.repeats, args.seed)
+
+    report = {
+        "label": args.label,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results
+    }
+
+    if args.chase_turns > 0:
+        report["chase"] = run_chase_benchmarks(args.sizes, args.densities, args.chase_turns, args.seed)
+
+    with open(args.output, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2)
+
+    print(f"Sonuçlar yazıldı: {args.output}")
+
+    mismatches = [result for result in results if not result["matches_bfs"]]
+    if mismatches:
+        sys.exit(f"UYUMSUZ: {len(mismatches)} ölçümde yol uzunluğu BFS ile farklı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+from array import array
+from collections import OrderedDict
+import hashlib
+import os
+import struct
+
+from pathfinding import distance_field
+
+
+TABLE_SUFFIX = ".nexthop"
+TABLE_MAGIC = b"SWNH"
+TABLE_VERSION = 2
+TABLE_HEADER = struct.Struct("<4sHH32sIII")
+ROW_HEADER = struct.Struct("<i")
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def grid_digest(maze):
+    digest = hashlib.sha256(struct.pack("<II", maze.width, maze.height))
+    digest.update(maze.grid)
+    return digest.digest()
+
+
+def table_path(map_path, rule):
+    return f"{map_path}.{rule}{TABLE_SUFFIX}"
+
+
+class DistanceTable:
+    def __init__(self, maze, rule, max_bytes=DEFAULT_MAX_BYTES):
+        self.maze = maze
+        self.rule = rule
+        self.tables = maze.get_rule_tables(rule)
+        self.max_rows = max(1, max_bytes // (4 * max(1, maze.size)))
+        self.rows = OrderedDict()
+        self.digest = None
+        self.dirty = False
+
+    def get_digest(self):
+        if self.digest is None:
+            self.digest = grid_digest(self.maze)
+        return self.digest
+
+    def build_row(self, target):
+        return distance_field(self.maze, self.maze.cell_location(target), self.rule)
+
+    def next_cell(self, row, cell):
+        distance = row[cell]
+        if distance <= 0:
+            return -1
+
+        for offsets, targets in self.tables:
+            for index in range(offsets[cell], offsets[cell + 1]):
+                if row[targets[index]] == distance - 1:
+                    return targets[index]
+        return -1
+
+    def add_row(self, target, row):
+        self.rows[target] = row
+        if len(self.rows) > self.max_rows:
+            self.rows.popitem(last=False)
+
+    def get_row(self, target):
+        row = self.rows.get(target)
+        if row is not None:
+            self.rows.move_to_end(target)
+            return row
+
+        row = self.build_row(target)
+        self.add_row(target, row)
+        self.dirty = True
+        return row
+
+    def next_step(self, location, target_location):
+        row = self.get_row(self.maze.cell_id(target_location))
+        next_cell = self.next_cell(row, self.maze.cell_id(location))
+        if next_cell < 0:
+            return None
+        return self.maze.cell_location(next_cell)
+
+    def path(self, location, target_location):
+        target = self.maze.cell_id(target_location)
+        row = self.get_row(target)
+        cell = self.maze.cell_id(location)
+        if row[cell] < 0:
+            return None
+
+        cells = [cell]
+        while cell != target:
+            cell = self.next_cell(row, cell)
+            cells.append(cell)
+        return [self.maze.cell_location(cell) for cell in cells]
+
+    def load(self, file_path):
+        with open(file_path, 'rb') as file:
+            header = file.read(TABLE_HEADER.size)
+            if len(header) < TABLE_HEADER.size:
+                return False
+
+            magic, version, _, digest, width, height, row_count = TABLE_HEADER.unpack(header)
+            if magic != TABLE_MAGIC or version != TABLE_VERSION or digest != self.get_digest():
+                return False
+            if width != self.maze.width or height != self.maze.height:
+                return False
+
+            row_size = 4 * self.maze.size
+            skipped = max(0, row_count - self.max_rows)
+            file.seek(skipped * (ROW_HEADER.size + row_size), os.SEEK_CUR)
+
+            for _ in range(row_count - skipped):
+                target, = ROW_HEADER.unpack(file.read(ROW_HEADER.size))
+                row = array('i')
+                row.frombytes(file.read(row_size))
+                if len(row) != self.maze.size:
+                    raise ValueError(f"{file_path}: eksik satır")
+                self.add_row(target, row)
+
+        return True
+
+    def save(self, file_path):
+        header = TABLE_HEADER.pack(TABLE_MAGIC, TABLE_VERSION, 0, self.get_digest(), self.maze.width,
+                                   self.maze.height, len(self.rows))
+
+        temporary_path = file_path + ".tmp"
+        with open(temporary_path, 'wb') as file:
+            file.write(header)
+            for target, row in self.rows.items():
+                file.write(ROW_HEADER.pack(target))
+                file.write(row.tobytes())
+        os.replace(temporary_path, file_path)
+        self.dirty = False
+
+
+def get_distance_table(maze, rule):
+    table = maze.distance_tables.get(rule)
+    if table is None:
+        table = DistanceTable(maze, rule)
+        if maze.source_path is not None:
+            try:
+                table.load(table_path(maze.source_path, rule))
+            except (OSError, ValueError, struct.error):
+                table.rows.clear()
+        maze.distance_tables[rule] = table
+    return table
+
+
+def save_distance_tables(maze):
+    if maze.source_path is None:
+        return
+
+    for rule, table in maze.distance_tables.items():
+        if table.dirty:
+            try:
+                table.save(table_path(maze.source_path, rule))
+            except OSError:
+                pass
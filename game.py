@@ -0,0 +1,127 @@
+import random
+
+from occupancy import Occupancy
+from Character import LukeSkywalker, MasterYoda, Stormtrooper, DarthVader, KyloRen
+from pathfinding import PathCache
+from planner import SerialPlanner
+
+
+MOVES = {
+    "up": (0, -1),
+    "down": (0, 1),
+    "left": (-1, 0),
+    "right": (1, 0)
+}
+
+
+def create_player(character_name, location):
+    if character_name == "Luke Skywalker":
+        return LukeSkywalker(location)
+    return MasterYoda(location)
+
+
+def create_enemies_with_random_doors(character_types, maze, rng=random, verbose=True):
+    enemies = []
+    available_doors = list(maze.doors.keys())
+
+    for char_type in character_types:
+        if available_doors:
+            random_door = rng.choice(available_doors)
+            enemy_location = maze.doors[random_door]
+
+            available_doors.remove(random_door)
+
+            if verbose:
+                print(f"Düşman oluşturuluyor: {char_type} - Kapı: {random_door} (rastgele)")
+
+            if char_type == "Stormtrooper":
+                enemies.append(Stormtrooper(enemy_location))
+            elif char_type == "Darth Vader":
+                enemies.append(DarthVader(enemy_location))
+            elif char_type == "Kylo Ren":
+                enemies.append(KyloRen(enemy_location))
+
+    return enemies
+
+
+class GameState:
+    def __init__(self, maze, character_types, character_name, seed=None, verbose=False, path_cache=None,
+                 search_algorithm=None, planner=None):
+        self.maze = maze
+        self.character_types = character_types
+        self.character_name = character_name
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.verbose = verbose
+        self.path_cache = path_cache if path_cache is not None else PathCache(maze)
+        self.search_algorithm = search_algorithm
+        self.planner = planner if planner is not None else SerialPlanner(maze)
+        self.occupancy = Occupancy(maze)
+        self.reset()
+
+    def reset(self):
+        self.player = create_player(self.character_name, self.maze.player_start)
+        self.enemies = self.spawn_enemies()
+        self.place_characters()
+        self.game_over = False
+        self.victory = False
+        self.turn = 0
+
+    def spawn_enemies(self):
+        enemies = create_enemies_with_random_doors(self.character_types, self.maze, self.rng, self.verbose)
+        if self.search_algorithm is not None:
+            for enemy in enemies:
+                enemy.search_algorithm = self.search_algorithm
+        return enemies
+
+    def place_characters(self):
+        self.occupancy.clear()
+        self.occupancy.add(self.player)
+        for enemy in self.enemies:
+            self.occupancy.add(enemy)
+
+    def is_finished(self):
+        return self.game_over or self.victory
+
+    def get_enemy_paths(self):
+        return self.path_cache.update(self.player, self.enemies)
+
+    def step(self, action):
+        events = []
+        if self.is_finished() or action not in MOVES:
+            return events
+
+        dx, dy = MOVES[action]
+        location = self.player.get_location()
+        new_location = self.maze.location(location.get_x() + dx, location.get_y() + dy)
+
+        if not self.maze.is_valid_move(new_location):
+            return events
+
+        self.occupancy.move(self.player, new_location)
+        self.turn += 1
+        events.append("moved")
+
+        if self.maze.is_trophy_location(new_location):
+            self.victory = True
+            events.append("victory")
+
+        next_locations = self.planner.plan(self.enemies, new_location)
+
+        for enemy, next_location in zip(self.enemies, next_locations):
+            if next_location:
+                self.occupancy.move(enemy, next_location, blocked_by_enemies=True)
+
+            if self.occupancy.same_cell(enemy, self.player):
+                events.append("caught")
+
+                self.game_over = self.player.lose_life()
+                self.player.set_location(self.maze.player_start)
+                self.enemies = self.spawn_enemies()
+                self.place_characters()
+
+                if self.game_over:
+                    events.append("game_over")
+                break
+
+        return events
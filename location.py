@@ -1,7 +1,15 @@
 class Location:
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Location değiştirilemez")
+
+    def __reduce__(self):
+        return Location, (self.x, self.y)
 
     def get_x(self):
         return self.x
@@ -9,13 +17,12 @@ class Location:
     def get_y(self):
         return self.y
 
-    def set_x(self, new_x):
-        self.x = new_x
-
-    def set_y(self, new_y):
-        self.y = new_y
-
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Location):
             return self.x == other.x and self.y == other.y
-        return False
\ No newline at end of file
+        return False
+
+    def __hash__(self):
+        return hash((self.x, self.y))
\ No newline at end of file
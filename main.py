@@ -1,171 +1,166 @@
-import pygame
+import argparse
+import atexit
 import random
-from location import Location
-from Character import LukeSkywalker, MasterYoda, Stormtrooper, DarthVader, KyloRen
-from maze import Maze
+import pygame
+import assets
+from distance_table import save_distance_tables
+from game import GameState
+from map_loader import load_map
+from planner import create_planner
+from profiler import create_profiler
+from replay import ReplayRecorder
 from ui import UI
 
 
-def read_map_file(file_path):
-    characters = []
-    maze_data = []
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-
-        for line in lines:
-            if line.startswith('Karakter:'):
-                parts = line.strip().split(',')
-                char_type = parts[0].split(':')[1].strip()
-                door = parts[1].split(':')[1].strip()
-                characters.append((char_type, door))
-                print(f"Karakter eklendi: {char_type} - Kapı: {door}")
-            elif any(c in '01' for c in line):
-                digits = [c for c in line if c in '01']
-                if digits:
-                    maze_row = [int(digit) for digit in digits]
-                    maze_data.append(maze_row)
-
-    return characters, maze_data
+DEFAULT_FPS = 30
 
+MAP_PATH = "Star wars harita.txt"
 
-def create_enemies_with_random_doors(character_types, maze):
-    enemies = []
-    available_doors = list(maze.doors.keys())
+KEY_ACTIONS = {
+    pygame.K_UP: "up",
+    pygame.K_DOWN: "down",
+    pygame.K_LEFT: "left",
+    pygame.K_RIGHT: "right"
+}
 
-    for char_type in character_types:
-        if available_doors:
-            random_door = random.choice(available_doors)
-            enemy_location = maze.doors[random_door]
 
-            available_doors.remove(random_door)
-
-            print(f"Düşman oluşturuluyor: {char_type} - Kapı: {random_door} (rastgele)")
+def main(target_fps=DEFAULT_FPS, workers=0, idle_timeout=None, profiler=None, seed=None, record_path=None):
+    pygame.init()
 
-            if char_type == "Stormtrooper":
-                enemies.append(Stormtrooper(enemy_location))
-            elif char_type == "Darth Vader":
-                enemies.append(DarthVader(enemy_location))
-            elif char_type == "Kylo Ren":
-                enemies.append(KyloRen(enemy_location))
+    recorder = ReplayRecorder(record_path) if record_path is not None else None
 
-    return enemies
+    planner = None
 
+    if profiler is None:
+        profiler = create_profiler()
+    if profiler.enabled:
+        atexit.register(profiler.write_trace)
 
-def main():
-    pygame.init()
-
-    pygame.mixer.music.load("assets/background_music.wav")
-    pygame.mixer.music.play(-1)
+    assets.play_music("assets/background_music.wav")
 
     while True:
-        characters, maze_data = read_map_file("Star wars harita.txt")
-
-        maze = Maze(maze_data)
+        characters, maze = load_map(MAP_PATH)
 
         ui = UI(maze)
 
         selected_character = ui.show_start_screen()
-
-        if selected_character == "Luke Skywalker":
-            player = LukeSkywalker(maze.player_start)
-        else:
-            player = MasterYoda(maze.player_start)
-
+        if selected_character == "quit":
+            break
 
         character_types = [char_type for char_type, _ in characters]
 
-        enemies = create_enemies_with_random_doors(character_types, maze)
-
-        running = True
-        game_over = False
-        victory = False
-
-        while running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    running = False
-
-                if not game_over and not victory:
-                    if event.type == pygame.KEYDOWN:
-                        if event.key in [pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_ESCAPE]:
-                            if event.key == pygame.K_ESCAPE:
-                                running = False
-                            else:
-                                new_location = Location(player.get_location().get_x(), player.get_location().get_y())
+        if planner is None or planner.maze is not maze:
+            if planner is not None:
+                planner.close()
+            planner = create_planner(maze, workers)
 
-                                if event.key == pygame.K_UP:
-                                    new_location.set_y(new_location.get_y() - 1)
-                                elif event.key == pygame.K_DOWN:
-                                    new_location.set_y(new_location.get_y() + 1)
-                                elif event.key == pygame.K_LEFT:
-                                    new_location.set_x(new_location.get_x() - 1)
-                                elif event.key == pygame.K_RIGHT:
-                                    new_location.set_x(new_location.get_x() + 1)
+        session_seed = seed
+        if recorder is not None:
+            if session_seed is None:
+                session_seed = random.randrange(2 ** 32)
+            recorder.start_session(MAP_PATH, maze, character_types, selected_character, session_seed)
 
-                                if maze.is_valid_move(new_location):
-                                    player.set_location(new_location)
+        state = GameState(maze, character_types, selected_character, seed=session_seed, verbose=True,
+                          planner=planner)
 
-                                    if maze.is_trophy_location(new_location):
-                                        victory = True
+        clock = pygame.time.Clock()
 
-                                    for enemy in enemies:
-                                        path = enemy.find_shortest_path(maze, player.get_location())
-                                        if path and len(path) > 1:
-                                            enemy.set_location(path[1])
-
-                                        if enemy.get_location().get_x() == player.get_location().get_x() and \
-                                                enemy.get_location().get_y() == player.get_location().get_y():
-                                            is_game_over = player.lose_life()
-
-                                            ui.play_caught_sound()
-
-                                            player.set_location(maze.player_start)
-
-                                            enemies = create_enemies_with_random_doors(character_types, maze)
-
-                                            game_over = is_game_over
-
-            ui.draw_maze()
-            ui.draw_characters(player, enemies)
-
-            if game_over:
-                action = ui.show_game_over()
-                if action == "play_again":
-                    player = LukeSkywalker(maze.player_start) if isinstance(player, LukeSkywalker) else MasterYoda(
-                        maze.player_start)
-
-                    enemies = create_enemies_with_random_doors(character_types, maze)
+        running = True
+        needs_redraw = True
 
-                    game_over = False
-                    victory = False
-                elif action == "menu":
-                    break
+        while running:
+            if needs_redraw:
+                events = pygame.event.get()
+            else:
+                events = [pygame.event.wait()] + pygame.event.get()
+
+            profiler.begin_frame()
+
+            with profiler.phase("events"):
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        running = False
+
+                    if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                        ui.full_update = True
+                        needs_redraw = True
+
+                    if not state.is_finished() and event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            running = False
+                        elif event.key in KEY_ACTIONS:
+                            if recorder is not None:
+                                recorder.record(KEY_ACTIONS[event.key])
+                            with profiler.phase("turn"):
+                                step_events = state.step(KEY_ACTIONS[event.key])
+
+                            if step_events:
+                                needs_redraw = True
+                            if "caught" in step_events:
+                                ui.play_caught_sound()
+
+            if needs_redraw:
+                with profiler.phase("draw_maze"):
+                    ui.draw_maze()
+                with profiler.phase("paths"):
+                    paths = state.get_enemy_paths()
+                with profiler.phase("draw_characters"):
+                    ui.draw_characters(state.player, state.enemies, paths)
+                if profiler.enabled:
+                    ui.draw_profile(profiler.summary_lines())
+                with profiler.phase("display"):
+                    ui.update_display()
+
+                needs_redraw = False
+
+            profiler.end_frame()
+
+            if state.is_finished():
+                if state.game_over:
+                    action = ui.show_game_over(idle_timeout)
                 else:
-                    running = False
-
+                    action = ui.show_victory(idle_timeout)
 
-            elif victory:
-                action = ui.show_victory()
                 if action == "play_again":
-                    player = LukeSkywalker(maze.player_start) if isinstance(player, LukeSkywalker) else MasterYoda(
-                        maze.player_start)
-
-                    enemies = create_enemies_with_random_doors(character_types, maze)
-
-                    game_over = False
-                    victory = False
+                    if recorder is not None:
+                        recorder.record("reset")
+                    state.reset()
+                    needs_redraw = True
                 elif action == "menu":
                     break
                 else:
                     running = False
 
-            pygame.display.flip()
+            clock.tick(target_fps)
+
+        if recorder is not None:
+            recorder.end_session(state)
 
         if not running:
             break
 
+    if planner is not None:
+        planner.close()
+    if recorder is not None:
+        recorder.close()
+
+    save_distance_tables(maze)
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Star Wars Labirent Oyunu")
+    parser.add_argument("--fps", type=int, default=DEFAULT_FPS, help="Saniyedeki en fazla kare sayısı")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="Düşman planlaması için işçi süreç sayısı (0: seri)")
+    parser.add_argument("--idle-timeout", type=float, default=None,
+                        help="Oyun sonu ekranından bu kadar saniye sonra menüye dön")
+    parser.add_argument("--profile", action="store_true",
+                        help="Kare ve tur sürelerini ölç, ekranda göster ve çıkışta iz dosyası yaz")
+    parser.add_argument("--profile-output", default=None, help="Chrome iz dosyasının yolu")
+    parser.add_argument("--seed", type=int, default=None, help="Düşman yerleşimi için rastgelelik tohumu")
+    parser.add_argument("--record", default=None, help="Oyunu tekrar oynatılabilir JSONL kaydına yaz")
+    args = parser.parse_args()
+
+    idle_timeout = int(args.idle_timeout * 1000) if args.idle_timeout is not None else None
+    main(args.fps, args.workers, idle_timeout, create_profiler(args.profile, args.profile_output), args.seed,
+         args.record)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import json
+import mmap
+import os
+import struct
+
+from location import Location
+from maze import Maze
+
+
+CACHE_SUFFIX = ".mapc"
+CACHE_MAGIC = b"SWMC"
+CACHE_VERSION = 1
+CACHE_HEADER = struct.Struct("<4sHHIIQQI")
+
+ROW_SEPARATORS = b" \t\r\n"
+ROW_CELLS = bytes.maketrans(b"01", b"\x00\x01")
+
+loaded_maps = {}
+
+
+def parse_location(text):
+    x, y = text.split(',')
+    return Location(int(x), int(y))
+
+
+def read_map_file(file_path):
+    characters = []
+    layout = {"doors": None, "trophy_location": None, "player_start": None}
+    grid = bytearray()
+    width = None
+    height = 0
+
+    with open(file_path, 'rb') as file:
+        for line_number, raw_line in enumerate(file, 1):
+            if raw_line[:1].isalpha():
+                line = raw_line.decode('utf-8').strip()
+
+                if line.startswith('Karakter:'):
+                    parts = line.split(',')
+                    char_type = parts[0].split(':')[1].strip()
+                    door = parts[1].split(':')[1].strip()
+                    characters.append((char_type, door))
+                    print(f"Karakter eklendi: {char_type} - Kapı: {door}")
+                elif line.startswith('Kapi:'):
+                    door, location = line.split(':', 1)[1].split(',', 1)
+                    if layout["doors"] is None:
+                        layout["doors"] = {}
+                    layout["doors"][door.strip()] = parse_location(location)
+                elif line.startswith('Kupa:'):
+                    layout["trophy_location"] = parse_location(line.split(':', 1)[1])
+                elif line.startswith('Baslangic:'):
+                    layout["player_start"] = parse_location(line.split(':', 1)[1])
+                else:
+                    raise ValueError(f"{file_path}:{line_number}: bilinmeyen satır: {line}")
+                continue
+
+            row = raw_line.translate(None, ROW_SEPARATORS)
+            if not row:
+                continue
+            if row.translate(None, b'01'):
+                raise ValueError(f"{file_path}:{line_number}: satırda 0 ve 1 dışında karakter var")
+
+            if width is None:
+                width = len(row)
+            elif len(row) != width:
+                raise ValueError(f"{file_path}:{line_number}: satır genişliği {len(row)}, beklenen {width}")
+
+            grid += row.translate(ROW_CELLS)
+            height += 1
+
+    maze = Maze.from_grid(width or 0, height, grid, **layout)
+    return characters, maze
+
+
+def write_map_cache(cache_path, source_stat, characters, maze):
+    metadata = json.dumps({
+        "characters": characters,
+        "doors": {door: [location.get_x(), location.get_y()] for door, location in maze.doors.items()},
+        "trophy_location": [maze.trophy_location.get_x(), maze.trophy_location.get_y()],
+        "player_start": [maze.player_start.get_x(), maze.player_start.get_y()]
+    }).encode('utf-8')
+
+    header = CACHE_HEADER.pack(CACHE_MAGIC, CACHE_VERSION, 0, maze.width, maze.height,
+                               source_stat.st_size, source_stat.st_mtime_ns, len(metadata))
+
+    temporary_path = cache_path + ".tmp"
+    with open(temporary_path, 'wb') as file:
+        file.write(header)
+        file.write(metadata)
+        file.write(maze.grid)
+    os.replace(temporary_path, cache_path)
+
+
+def read_map_cache(cache_path, source_stat):
+    with open(cache_path, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapped) < CACHE_HEADER.size:
+        return None
+
+    magic, version, _, width, height, source_size, source_mtime, metadata_size = \
+        CACHE_HEADER.unpack_from(mapped, 0)
+
+    if magic != CACHE_MAGIC or version != CACHE_VERSION:
+        return None
+    if source_size != source_stat.st_size or source_mtime != source_stat.st_mtime_ns:
+        return None
+
+    grid_start = CACHE_HEADER.size + metadata_size
+    if len(mapped) != grid_start + width * height:
+        return None
+
+    metadata = json.loads(mapped[CACHE_HEADER.size:grid_start].decode('utf-8'))
+    grid = memoryview(mapped)[grid_start:]
+
+    doors = {door: Location(x, y) for door, (x, y) in metadata["doors"].items()}
+    maze = Maze.from_grid(width, height, grid, doors, Location(*metadata["trophy_location"]),
+                          Location(*metadata["player_start"]))
+    characters = [(char_type, door) for char_type, door in metadata["characters"]]
+
+    return characters, maze
+
+
+def load_map(file_path):
+    source_stat = os.stat(file_path)
+    cache_key = os.path.abspath(file_path)
+    stamp = (source_stat.st_size, source_stat.st_mtime_ns)
+
+    loaded = loaded_maps.get(cache_key)
+    if loaded is not None and loaded[0] == stamp:
+        characters, maze = loaded[1]
+        return list(characters), maze
+
+    cache_path = file_path + CACHE_SUFFIX
+
+    try:
+        cached = read_map_cache(cache_path, source_stat)
+    except (OSError, ValueError, KeyError, struct.error):
+        cached = None
+
+    if cached is not None:
+        characters, maze = cached
+    else:
+        characters, maze = read_map_file(file_path)
+
+        try:
+            write_map_cache(cache_path, source_stat, characters, maze)
+        except OSError:
+            pass
+
+    maze.source_path = file_path
+    loaded_maps[cache_key] = (stamp, (characters, maze))
+    return list(characters), maze
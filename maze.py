@@ -1,23 +1,114 @@
+from array import array
+
 from location import Location
 
 
-class Maze:
-    def __init__(self, maze_data):
-        self.data = maze_data
-        self.height = len(maze_data)
-        self.width = len(maze_data[0]) if self.height > 0 else 0
+WALK = "walk"
+IGNORE_WALLS = "ignore_walls"
+DOUBLE_STEP = "double_step"
+
+ALL_NEIGHBORS = "all_neighbors"
+DOUBLE_STEP_ONLY = "double_step_only"
+
+DIRECTIONS = [
+    (0, -1),
+    (1, 0),
+    (0, 1),
+    (-1, 0)
+]
+
+DOUBLE_DIRECTIONS = [
+    (0, -2),
+    (2, 0),
+    (0, 2),
+    (-2, 0),
+    (1, -1),
+    (1, 1),
+    (-1, 1),
+    (-1, -1)
+]
+
+TABLE_MOVES = {
+    WALK: [(dx, dy, None) for dx, dy in DIRECTIONS],
+    ALL_NEIGHBORS: [(dx, dy, None) for dx, dy in DIRECTIONS],
+    DOUBLE_STEP_ONLY: [(dx, dy, (dx // 2, dy // 2)) for dx, dy in DOUBLE_DIRECTIONS]
+}
+TABLE_MOVES[DOUBLE_STEP] = TABLE_MOVES[DOUBLE_STEP_ONLY] + TABLE_MOVES[WALK]
+
+BITBOARD_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
 
-        self.doors = {
-            'A': Location(0, 5),
-            'B': Location(4, 0),
-            'C': Location(12, 0),
-            'D': Location(13, 5),
-            'E': Location(4, 10)
-        }
+RULE_TABLES = {
+    WALK: (WALK,),
+    IGNORE_WALLS: (ALL_NEIGHBORS,),
+    DOUBLE_STEP: (DOUBLE_STEP,)
+}
 
-        self.trophy_location = Location(13, 9)
 
-        self.player_start = Location(6, 5)
+class Maze:
+    def __init__(self, maze_data, doors=None, trophy_location=None, player_start=None):
+        height = len(maze_data)
+        width = len(maze_data[0]) if height > 0 else 0
+        grid = bytearray(1 if cell == 1 else 0 for row in maze_data for cell in row)
+
+        self.setup(width, height, grid, doors, trophy_location, player_start)
+        self._data = maze_data
+
+    @classmethod
+    def from_grid(cls, width, height, grid, doors=None, trophy_location=None, player_start=None):
+        maze = cls.__new__(cls)
+        maze.setup(width, height, grid, doors, trophy_location, player_start)
+        return maze
+
+    def setup(self, width, height, grid, doors, trophy_location, player_start):
+        self.width = width
+        self.height = height
+        self.size = width * height
+
+        self.grid = grid
+        self.locations = {}
+        self.tables = {}
+        self.bitboards = None
+        self.distance_tables = {}
+        self.source_path = None
+        self._data = None
+
+        if doors is None:
+            doors = {
+                'A': Location(0, 5),
+                'B': Location(4, 0),
+                'C': Location(12, 0),
+                'D': Location(13, 5),
+                'E': Location(4, 10)
+            }
+        self.doors = {door: self.intern(location) for door, location in doors.items()}
+
+        self.trophy_location = self.intern(trophy_location if trophy_location is not None else Location(13, 9))
+
+        self.player_start = self.intern(player_start if player_start is not None else Location(6, 5))
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = [list(self.grid[y * self.width:(y + 1) * self.width]) for y in range(self.height)]
+        return self._data
+
+    def cell_id(self, location):
+        return location.get_y() * self.width + location.get_x()
+
+    def cell_location(self, cell):
+        location = self.locations.get(cell)
+        if location is None:
+            location = Location(cell % self.width, cell // self.width)
+            self.locations[cell] = location
+        return location
+
+    def location(self, x, y):
+        if x < 0 or y < 0 or x >= self.width or y >= self.height:
+            return Location(x, y)
+        return self.cell_location(y * self.width + x)
+
+    def intern(self, location):
+        return self.location(location.get_x(), location.get_y())
 
     def is_valid_move(self, location):
         x, y = location.get_x(), location.get_y()
@@ -25,7 +116,7 @@ class Maze:
         if x < 0 or y < 0 or x >= self.width or y >= self.height:
             return False
 
-        return self.data[y][x] == 1
+        return self.grid[y * self.width + x] == 1
 
     def is_wall(self, location):
         x, y = location.get_x(), location.get_y()
@@ -33,78 +124,79 @@ class Maze:
         if x < 0 or y < 0 or x >= self.width or y >= self.height:
             return True
 
-        return self.data[y][x] == 0
+        return self.grid[y * self.width + x] == 0
 
     def is_trophy_location(self, location):
         return location.get_x() == self.trophy_location.get_x() and \
             location.get_y() == self.trophy_location.get_y()
 
-    def get_valid_neighbors(self, location):
-        x, y = location.get_x(), location.get_y()
-        neighbors = []
+    def get_table(self, name):
+        if name not in self.tables:
+            self.tables[name] = self.compile_table(name)
+        return self.tables[name]
 
-        directions = [
-            (0, -1),
-            (1, 0),
-            (0, 1),
-            (-1, 0)
-        ]
+    def get_rule_tables(self, rule):
+        if rule not in RULE_TABLES:
+            raise ValueError(f"Unknown movement rule: {rule}")
+        return [self.get_table(name) for name in RULE_TABLES[rule]]
 
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
-            new_location = Location(new_x, new_y)
+    def compile_table(self, name):
+        width, height, grid = self.width, self.height, self.grid
+        moves = TABLE_MOVES[name]
+        check_walls = name != ALL_NEIGHBORS
 
-            if self.is_valid_move(new_location):
-                neighbors.append(new_location)
+        offsets = array('i', [0]) * (self.size + 1)
+        targets = array('i')
 
-        return neighbors
+        for y in range(height):
+            for x in range(width):
+                cell = y * width + x
 
-    def get_all_neighbors(self, location):
-        x, y = location.get_x(), location.get_y()
-        neighbors = []
+                for dx, dy, midpoint in moves:
+                    new_x, new_y = x + dx, y + dy
+                    if not (0 <= new_x < width and 0 <= new_y < height):
+                        continue
 
-        directions = [
-            (0, -1),
-            (1, 0),
-            (0, 1),
-            (-1, 0)
-        ]
+                    neighbor = new_y * width + new_x
+                    if check_walls and not grid[neighbor]:
+                        continue
+                    if midpoint is not None and not grid[(y + midpoint[1]) * width + x + midpoint[0]]:
+                        continue
 
-        for dx, dy in directions:
-            new_x, new_y = x + dx, y + dy
+                    targets.append(neighbor)
 
-            if 0 <= new_x < self.width and 0 <= new_y < self.height:
-                neighbors.append(Location(new_x, new_y))
+                offsets[cell + 1] = len(targets)
 
-        return neighbors
+        return offsets, targets
 
-    def get_double_step_neighbors(self, location):
-        x, y = location.get_x(), location.get_y()
-        neighbors = []
+    def get_bitboards(self):
+        if self.bitboards is None:
+            width = self.width
+            rows = [bytes(self.grid[y * width:(y + 1) * width]).translate(BITBOARD_DIGITS) for y in range(self.height)]
+            walkable = int(b"0".join(rows)[::-1] or b"0", 2)
+            inside = int(b"0".join([b"1" * width] * self.height)[::-1] or b"0", 2)
+            self.bitboards = (width + 1, walkable, inside)
+        return self.bitboards
 
-        double_directions = [
-            (0, -2),
-            (2, 0),
-            (0, 2),
-            (-2, 0),
-            (1, -1),
-            (1, 1),
-            (-1, 1),
-            (-1, -1)
-        ]
+    def get_neighbor_cells(self, cell, rule):
+        neighbors = []
+        for offsets, targets in self.get_rule_tables(rule):
+            neighbors.extend(targets[offsets[cell]:offsets[cell + 1]])
+        return neighbors
 
-        for dx, dy in double_directions:
-            new_x, new_y = x + dx, y + dy
-            new_location = Location(new_x, new_y)
+    def get_valid_neighbors(self, location):
+        return self.get_move_neighbors(location, WALK)
 
-            mid_x, mid_y = x + dx // 2, y + dy // 2
-            mid_location = Location(mid_x, mid_y)
+    def get_all_neighbors(self, location):
+        return self.get_move_neighbors(location, IGNORE_WALLS)
 
-            if 0 <= new_x < self.width and 0 <= new_y < self.height and \
-                    self.is_valid_move(new_location) and self.is_valid_move(mid_location):
-                neighbors.append(new_location)
+    def get_double_step_neighbors(self, location):
+        offsets, targets = self.get_table(DOUBLE_STEP_ONLY)
+        cell = self.cell_id(location)
+        return [self.cell_location(neighbor) for neighbor in targets[offsets[cell]:offsets[cell + 1]]]
 
-        return neighbors
+    def get_move_neighbors(self, location, rule):
+        return [self.cell_location(neighbor) for neighbor in self.get_neighbor_cells(self.cell_id(location), rule)]
 
     def print_maze(self):
         for row in self.data:
@@ -0,0 +1,218 @@
+import argparse
+import random
+import time
+
+from location import Location
+from maze import Maze
+
+
+KINDS = ["perfect", "braided", "arena"]
+
+DOOR_KEYS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+DEFAULT_CHARACTERS = ["Stormtrooper", "Darth Vader", "Kylo Ren"]
+
+DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
+
+class GeneratedMap:
+    def __init__(self, width, height, grid, doors, trophy_location, player_start):
+        self.width = width
+        self.height = height
+        self.grid = grid
+        self.doors = doors
+        self.trophy_location = trophy_location
+        self.player_start = player_start
+
+    def to_maze(self):
+        return Maze.from_grid(self.width, self.height, self.grid, dict(self.doors),
+                              self.trophy_location, self.player_start)
+
+
+def lattice_size(width, height):
+    return (width - 1) // 2, (height - 1) // 2
+
+
+def carve_perfect(width, height, rng):
+    grid = bytearray(width * height)
+    columns, rows = lattice_size(width, height)
+
+    for row in range(rows):
+        y = 2 * row + 1
+        line = y * width
+        run_start = 0
+
+        for column in range(columns):
+            x = 2 * column + 1
+            grid[line + x] = 1
+
+            if row > 0 and (column == columns - 1 or rng.random() < 0.5):
+                up_x = 2 * (run_start + int(rng.random() * (column - run_start + 1))) + 1
+                grid[line - width + up_x] = 1
+                run_start = column + 1
+            else:
+                grid[line + x + 1] = 1
+
+        if row == 0:
+            grid[line + 2 * columns] = 0
+
+    return grid
+
+
+def braid(grid, width, height, rng, ratio):
+    columns, rows = lattice_size(width, height)
+    steps = ((0, -1), (1, 0), (0, 1), (-1, 0))
+
+    for row in range(rows):
+        y = 2 * row + 1
+        for column in range(columns):
+            x = 2 * column + 1
+            cell = y * width + x
+
+            openings = 0
+            for dx, dy in steps:
+                openings += grid[cell + dy * width + dx]
+
+            if openings != 1 or rng.random() >= ratio:
+                continue
+
+            walls = [
+                (dx, dy) for dx, dy in steps
+                if 0 < x + 2 * dx < 2 * columns and 0 < y + 2 * dy < 2 * rows and not grid[cell + dy * width + dx]
+            ]
+            if walls:
+                dx, dy = rng.choice(walls)
+                grid[cell + dy * width + dx] = 1
+
+    return grid
+
+
+def carve_arena(width, height, rng, pillar_density):
+    columns, rows = lattice_size(width, height)
+    grid = bytearray(width * height)
+    interior = bytes([1]) * (2 * columns - 1)
+    threshold = int(pillar_density * 256)
+    pillars = bytes.maketrans(bytes(range(256)), bytes([0] * threshold + [1] * (256 - threshold)))
+
+    for y in range(1, 2 * rows):
+        line = y * width + 1
+        grid[line:line + len(interior)] = interior
+
+        if y % 2 == 0:
+            grid[line + 1:line + len(interior):2] = rng.randbytes(columns - 1).translate(pillars)
+
+    return grid
+
+
+def place_doors(grid, width, height, rng, door_count):
+    columns, rows = lattice_size(width, height)
+    sides = ["left", "top", "right", "bottom"]
+    free = {side: list(range(rows if side in ("left", "right") else columns)) for side in sides}
+    doors = {}
+
+    if door_count > len(DOOR_KEYS):
+        raise ValueError(f"En fazla {len(DOOR_KEYS)} kapı yerleştirilebilir")
+    if door_count > 2 * (rows + columns):
+        raise ValueError(f"{width}x{height} haritaya en fazla {2 * (rows + columns)} kapı sığar")
+
+    side_index = 0
+    for index in range(door_count):
+        while not free[sides[side_index % len(sides)]]:
+            side_index += 1
+        side = sides[side_index % len(sides)]
+        side_index += 1
+
+        positions = free[side]
+        position = positions.pop(rng.randrange(len(positions)))
+
+        if side in ("left", "right"):
+            y = 2 * position + 1
+            cells = [0] if side == "left" else range(2 * columns, width)
+            for x in cells:
+                grid[y * width + x] = 1
+            door = Location(0 if side == "left" else width - 1, y)
+        else:
+            x = 2 * position + 1
+            cells = [0] if side == "top" else range(2 * rows, height)
+            for y in cells:
+                grid[y * width + x] = 1
+            door = Location(x, 0 if side == "top" else height - 1)
+
+        doors[DOOR_KEYS[index]] = door
+
+    return doors
+
+
+def generate_map(width, height, kind="perfect", seed=None, braid_ratio=0.5, pillar_density=0.2, door_count=5):
+    if width < 7 or height < 7:
+        raise ValueError("Harita en az 7x7 olmalı")
+    if kind not in KINDS:
+        raise ValueError(f"Bilinmeyen harita türü: {kind}")
+
+    rng = random.Random(seed)
+
+    if kind == "arena":
+        grid = carve_arena(width, height, rng, pillar_density)
+    else:
+        grid = carve_perfect(width, height, rng)
+        if kind == "braided":
+            braid(grid, width, height, rng, braid_ratio)
+
+    doors = place_doors(grid, width, height, rng, door_count)
+
+    columns, rows = lattice_size(width, height)
+    player_start = Location(2 * (columns // 2) + 1, 2 * (rows // 2) + 1)
+    trophy_location = Location(2 * columns - 1, 2 * rows - 1)
+
+    return GeneratedMap(width, height, grid, doors, trophy_location, player_start)
+
+
+def write_map_file(file_path, generated_map, characters):
+    width = generated_map.width
+    row = bytearray(2 * width - 1)
+    row[1::2] = b"\t" * (width - 1)
+
+    with open(file_path, 'wb') as file:
+        for door, location in generated_map.doors.items():
+            file.write(f"Kapi:{door},{location.get_x()},{location.get_y()}\n".encode('utf-8'))
+
+        trophy_location, player_start = generated_map.trophy_location, generated_map.player_start
+        file.write(f"Kupa:{trophy_location.get_x()},{trophy_location.get_y()}\n".encode('utf-8'))
+        file.write(f"Baslangic:{player_start.get_x()},{player_start.get_y()}\n".encode('utf-8'))
+
+        for char_type, door in characters:
+            file.write(f"Karakter:{char_type},Kapi:{door}\n".encode('utf-8'))
+
+        for y in range(generated_map.height):
+            row[0::2] = generated_map.grid[y * width:(y + 1) * width].translate(DIGITS)
+            file.write(row)
+            file.write(b"\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rastgele labirent haritası üretir")
+    parser.add_argument("output")
+    parser.add_argument("--width", type=int, default=101)
+    parser.add_argument("--height", type=int, default=101)
+    parser.add_argument("--kind", choices=KINDS, default="perfect")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--braid", type=float, default=0.5)
+    parser.add_argument("--pillars", type=float, default=0.2)
+    parser.add_argument("--doors", type=int, default=5)
+    parser.add_argument("--characters", nargs="*", default=DEFAULT_CHARACTERS)
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    generated_map = generate_map(args.width, args.height, args.kind, args.seed, args.braid, args.pillars,
+                                 args.doors)
+
+    door_keys = list(generated_map.doors)
+    characters = [(char_type, door_keys[index % len(door_keys)]) for index, char_type in enumerate(args.characters)]
+    write_map_file(args.output, generated_map, characters)
+
+    print(f"{args.width}x{args.height} {args.kind} harita yazıldı: {args.output} "
+          f"({time.perf_counter() - start_time:.2f} s)")
+
+
+if __name__ == "__main__":
+    main()
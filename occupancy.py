@@ -0,0 +1,41 @@
+from array import array
+
+from Character import EnemyCharacter
+
+
+class Occupancy:
+    def __init__(self, maze):
+        self.maze = maze
+        self.enemy_counts = array('H', [0]) * maze.size
+        self.cells = {}
+
+    def clear(self):
+        for cell in self.cells.values():
+            self.enemy_counts[cell] = 0
+        self.cells = {}
+
+    def add(self, character):
+        cell = self.maze.cell_id(character.get_location())
+        self.cells[character] = cell
+        if isinstance(character, EnemyCharacter):
+            self.enemy_counts[cell] += 1
+
+    def move(self, character, new_location, blocked_by_enemies=False):
+        old_cell = self.cells[character]
+        new_cell = self.maze.cell_id(new_location)
+        if new_cell == old_cell:
+            character.set_location(new_location)
+            return True
+        if blocked_by_enemies and self.enemy_counts[new_cell]:
+            return False
+
+        character.set_location(new_location)
+        self.cells[character] = new_cell
+
+        if isinstance(character, EnemyCharacter):
+            self.enemy_counts[old_cell] -= 1
+            self.enemy_counts[new_cell] += 1
+        return True
+
+    def same_cell(self, first, second):
+        return self.cells[first] == self.cells[second]
@@ -1,76 +1,468 @@
+from array import array
 from collections import deque
 import heapq
 from location import Location
+from maze import WALK, IGNORE_WALLS, DOUBLE_STEP
 
+STEP_REACH = {WALK: 1, IGNORE_WALLS: 1, DOUBLE_STEP: 2}
 
-def bfs(maze, start_location, target_location):
-    queue = deque([(start_location, [start_location])])
-    visited = set([(start_location.get_x(), start_location.get_y())])
+UNREACHABLE = float("inf")
+
+search_stats = {"searches": 0, "expanded": 0}
+
+def reset_search_stats():
+    search_stats["searches"] = 0
+    search_stats["expanded"] = 0
+
+def record_search(expanded):
+    search_stats["searches"] += 1
+    search_stats["expanded"] += expanded
+
+def reconstruct_path(maze, parents, start, target):
+    cells = [target]
+    while cells[-1] != start:
+        cells.append(parents[cells[-1]])
+    cells.reverse()
+    return [maze.cell_location(cell) for cell in cells]
+
+def bfs_by_rule(maze, start_location, target_location, rule):
+    start = maze.cell_id(start_location)
+    target = maze.cell_id(target_location)
+    tables = maze.get_rule_tables(rule)
+    parents = array('i', [-1]) * maze.size
+    parents[start] = start
+    queue = deque([start])
+    expanded = 0
 
     while queue:
-        current_loc, path = queue.popleft()
-        if (current_loc.get_x() == target_location.get_x() and
-                current_loc.get_y() == target_location.get_y()):
-            return path
-        for neighbor in maze.get_valid_neighbors(current_loc):
-            neighbor_pos = (neighbor.get_x(), neighbor.get_y())
-            if neighbor_pos not in visited:
-                visited.add(neighbor_pos)
-                new_path = path + [neighbor]
-                queue.append((neighbor, new_path))
+        current = queue.popleft()
+        expanded += 1
+        if current == target:
+            record_search(expanded)
+            return reconstruct_path(maze, parents, start, target)
+
+        for offsets, targets in tables:
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[index]
+                if parents[neighbor] < 0:
+                    parents[neighbor] = current
+                    queue.append(neighbor)
 
+    record_search(expanded)
     return None
 
+def bfs(maze, start_location, target_location):
+    return bfs_by_rule(maze, start_location, target_location, WALK)
+
 def bfs_double_step(maze, start_location, target_location):
-    queue = deque([(start_location, [start_location])])
-    visited = set([(start_location.get_x(), start_location.get_y())])
+    return bfs_by_rule(maze, start_location, target_location, DOUBLE_STEP)
 
-    while queue:
-        current_loc, path = queue.popleft()
-        if (current_loc.get_x() == target_location.get_x() and
-                current_loc.get_y() == target_location.get_y()):
-            return path
-        double_neighbors = maze.get_double_step_neighbors(current_loc)
+def bfs_ignore_walls(maze, start_location, target_location):
+    return bfs_by_rule(maze, start_location, target_location, IGNORE_WALLS)
+
+def manhattan_next_step(maze, location, target_location):
+    x, y = location.get_x(), location.get_y()
+    target_x, target_y = target_location.get_x(), target_location.get_y()
 
-        for double_neighbor in double_neighbors:
-            double_pos = (double_neighbor.get_x(), double_neighbor.get_y())
+    if target_y < y:
+        return maze.cell_location((y - 1) * maze.width + x)
+    if target_x > x:
+        return maze.cell_location(y * maze.width + x + 1)
+    if target_y > y:
+        return maze.cell_location((y + 1) * maze.width + x)
+    if target_x < x:
+        return maze.cell_location(y * maze.width + x - 1)
+    return None
 
-            if double_pos not in visited:
-                visited.add(double_pos)
-                new_path = path + [double_neighbor]
-                queue.append((double_neighbor, new_path))
-        normal_neighbors = maze.get_valid_neighbors(current_loc)
+def manhattan_path(maze, start_location, target_location):
+    path = [start_location]
+    next_location = manhattan_next_step(maze, start_location, target_location)
+    while next_location is not None:
+        path.append(next_location)
+        next_location = manhattan_next_step(maze, next_location, target_location)
+    return path
 
-        for neighbor in normal_neighbors:
-            neighbor_pos = (neighbor.get_x(), neighbor.get_y())
+def astar(maze, start_location, target_location, rule):
+    width = maze.width
+    start = maze.cell_id(start_location)
+    target = maze.cell_id(target_location)
+    target_x, target_y = target % width, target // width
+    reach = STEP_REACH[rule]
+    tables = maze.get_rule_tables(rule)
 
-            if neighbor_pos not in visited:
-                visited.add(neighbor_pos)
-                new_path = path + [neighbor]
-                queue.append((neighbor, new_path))
+    def heuristic(cell):
+        return (abs(cell % width - target_x) + abs(cell // width - target_y) + reach - 1) // reach
 
+    parents = {start: start}
+    costs = {start: 0}
+    closed = set()
+    heap = [(heuristic(start), 0, start)]
+    expanded = 0
+
+    while heap:
+        _, _, current = heapq.heappop(heap)
+        if current in closed:
+            continue
+        closed.add(current)
+        expanded += 1
+
+        if current == target:
+            record_search(expanded)
+            return reconstruct_path(maze, parents, start, target)
+
+        next_cost = costs[current] + 1
+        for offsets, targets in tables:
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[index]
+                if neighbor not in closed and next_cost < costs.get(neighbor, next_cost + 1):
+                    costs[neighbor] = next_cost
+                    parents[neighbor] = current
+                    estimate = heuristic(neighbor)
+                    heapq.heappush(heap, (next_cost + estimate, estimate, neighbor))
+
+    record_search(expanded)
     return None
 
-def bfs_ignore_walls(maze, start_location, target_location):
-    queue = deque([(start_location, [start_location])])
-    visited = set()
+def bidirectional_bfs(maze, start_location, target_location, rule):
+    start = maze.cell_id(start_location)
+    target = maze.cell_id(target_location)
+    if start == target:
+        record_search(0)
+        return [maze.cell_location(start)]
+
+    tables = maze.get_rule_tables(rule)
+    forward = {start: start}
+    backward = {target: target}
+    forward_frontier = [start]
+    backward_frontier = [target]
+    expanded = 0
+
+    while forward_frontier and backward_frontier:
+        expand_forward = len(forward_frontier) <= len(backward_frontier)
+        if expand_forward:
+            frontier, parents, others = forward_frontier, forward, backward
+        else:
+            frontier, parents, others = backward_frontier, backward, forward
+
+        next_frontier = []
+        meeting = None
+
+        for current in frontier:
+            expanded += 1
+            for offsets, targets in tables:
+                for index in range(offsets[current], offsets[current + 1]):
+                    neighbor = targets[index]
+                    if neighbor not in parents:
+                        parents[neighbor] = current
+                        next_frontier.append(neighbor)
+                        if meeting is None and neighbor in others:
+                            meeting = neighbor
+
+            if meeting is not None:
+                record_search(expanded)
+                cells = reconstruct_path(maze, forward, start, meeting)
+                while meeting != target:
+                    meeting = backward[meeting]
+                    cells.append(maze.cell_location(meeting))
+                return cells
+
+        if expand_forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    record_search(expanded)
+    return None
+
+def expand_bitboard(frontier, rule, stride, walkable, inside):
+    if rule == IGNORE_WALLS:
+        return ((frontier >> stride) | (frontier << stride) | (frontier >> 1) | (frontier << 1)) & inside
+
+    up = (frontier >> stride) & walkable
+    down = (frontier << stride) & walkable
+    left = (frontier >> 1) & walkable
+    right = (frontier << 1) & walkable
+    reached = up | down | left | right
+
+    if rule == DOUBLE_STEP:
+        reached |= ((up >> stride) | (down << stride) | (left >> 1) | (right << 1) | (up << 1) | (left << stride) |
+                    ((frontier & walkable) << (stride + 1)) | (frontier >> (stride + 1))) & walkable
+
+    return reached
+
+def bitboard_layers(maze, root_location, rule, stop_location=None):
+    stride, walkable, inside = maze.get_bitboards()
+    if rule not in STEP_REACH:
+        raise ValueError(f"Unknown movement rule: {rule}")
+
+    root = 1 << (root_location.get_y() * stride + root_location.get_x())
+    stop = 1 << (stop_location.get_y() * stride + stop_location.get_x()) if stop_location is not None else 0
+    planes = [root, 0, 0]
+    visited = frontier = root
+    distance = 0
+
+    while frontier and not visited & stop:
+        frontier = expand_bitboard(frontier, rule, stride, walkable, inside) & ~visited
+        if not frontier:
+            break
+        distance += 1
+        visited |= frontier
+        planes[distance % 3] |= frontier
+
+    record_search(visited.bit_count())
+    return planes, visited, distance
+
+def bitboard_bfs(maze, start_location, target_location, rule):
+    planes, visited, distance = bitboard_layers(maze, target_location, rule, start_location)
+    stride = maze.width + 1
+    start = maze.cell_id(start_location)
+    if not visited >> (start_location.get_y() * stride + start_location.get_x()) & 1:
+        return None
+
+    size = (maze.height * stride + 7) // 8
+    residues = [plane.to_bytes(size, 'little') for plane in planes]
+    width = maze.width
+
+    cells = [start]
+    cell = start
+    while distance > 0:
+        distance -= 1
+        residue = residues[distance % 3]
+        for neighbor in maze.get_neighbor_cells(cell, rule):
+            bit = neighbor + neighbor // width
+            if residue[bit >> 3] >> (bit & 7) & 1:
+                cell = neighbor
+                break
+        cells.append(cell)
+
+    return [maze.cell_location(cell) for cell in cells]
+
+SEARCH_ALGORITHMS = {
+    "bfs": bfs_by_rule,
+    "astar": astar,
+    "bidirectional": bidirectional_bfs,
+    "bitboard": bitboard_bfs
+}
+
+def find_path(maze, start_location, target_location, rule, algorithm="bfs"):
+    if algorithm not in SEARCH_ALGORITHMS:
+        raise ValueError(f"Unknown search algorithm: {algorithm}")
+    return SEARCH_ALGORITHMS[algorithm](maze, start_location, target_location, rule)
+
+class IncrementalSearch:
+    def __init__(self, maze, rule):
+        self.maze = maze
+        self.rule = rule
+        self.tables = maze.get_rule_tables(rule)
+        self.reach = STEP_REACH[rule]
+        self.start = None
+        self.target = None
+        self.offset = 0
+        self.g = {}
+        self.rhs = {}
+        self.open = {}
+        self.heap = []
+
+    def reset(self, start, target):
+        self.start = start
+        self.target = target
+        self.offset = 0
+        self.g = {}
+        self.rhs = {target: 0}
+        self.open = {}
+        self.heap = []
+        self.update_cell(target)
+
+    def heuristic(self, first, second):
+        width = self.maze.width
+        distance = abs(first % width - second % width) + abs(first // width - second // width)
+        return (distance + self.reach - 1) // self.reach
+
+    def key(self, cell):
+        value = min(self.g.get(cell, UNREACHABLE), self.rhs.get(cell, UNREACHABLE))
+        return (value + self.heuristic(self.start, cell) + self.offset, value)
+
+    def best_rhs(self, cell):
+        if cell == self.target:
+            return 0
+
+        g = self.g
+        best = UNREACHABLE
+        for offsets, targets in self.tables:
+            for index in range(offsets[cell], offsets[cell + 1]):
+                value = g.get(targets[index], UNREACHABLE)
+                if value < best:
+                    best = value
+        return best + 1
+
+    def update_cell(self, cell):
+        if self.g.get(cell, UNREACHABLE) != self.rhs.get(cell, UNREACHABLE):
+            key = self.key(cell)
+            if self.open.get(cell) != key:
+                self.open[cell] = key
+                heapq.heappush(self.heap, (key, cell))
+        elif cell in self.open:
+            del self.open[cell]
+
+    def top(self):
+        heap, open_keys = self.heap, self.open
+        if len(heap) > 4 * len(open_keys) + 64:
+            heap[:] = [(key, cell) for cell, key in open_keys.items()]
+            heapq.heapify(heap)
+
+        while heap and open_keys.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def compute(self):
+        g, rhs, open_keys, heap = self.g, self.rhs, self.open, self.heap
+        start, target, tables = self.start, self.target, self.tables
+        expanded = 0
+
+        while True:
+            top = self.top()
+            if top is None:
+                break
+
+            old_key, cell = top
+            if old_key > self.key(start) and rhs.get(start, UNREACHABLE) <= g.get(start, UNREACHABLE):
+                break
+
+            new_key = self.key(cell)
+            if old_key < new_key:
+                open_keys[cell] = new_key
+                heapq.heappush(heap, (new_key, cell))
+                continue
+
+            heapq.heappop(heap)
+            del open_keys[cell]
+            expanded += 1
+
+            old_g = g.get(cell, UNREACHABLE)
+            cell_rhs = rhs.get(cell, UNREACHABLE)
+
+            if old_g > cell_rhs:
+                g[cell] = cell_rhs
+                for offsets, targets in tables:
+                    for index in range(offsets[cell], offsets[cell + 1]):
+                        neighbor = targets[index]
+                        if neighbor != target and cell_rhs + 1 < rhs.get(neighbor, UNREACHABLE):
+                            rhs[neighbor] = cell_rhs + 1
+                        self.update_cell(neighbor)
+            else:
+                del g[cell]
+                for offsets, targets in tables:
+                    for index in range(offsets[cell], offsets[cell + 1]):
+                        neighbor = targets[index]
+                        if neighbor != target and rhs.get(neighbor, UNREACHABLE) == old_g + 1:
+                            rhs[neighbor] = self.best_rhs(neighbor)
+                        self.update_cell(neighbor)
+                self.update_cell(cell)
+
+        record_search(expanded)
+
+    def update(self, start_location, target_location):
+        start = self.maze.cell_id(start_location)
+        target = self.maze.cell_id(target_location)
+
+        if self.start is None:
+            self.reset(start, target)
+        else:
+            if start != self.start:
+                self.offset += self.heuristic(self.start, start)
+                self.start = start
+
+            if target != self.target:
+                previous = self.target
+                self.target = target
+                self.rhs[previous] = self.best_rhs(previous)
+                self.update_cell(previous)
+                self.rhs[target] = 0
+                self.update_cell(target)
+
+        self.compute()
+
+    def next_cell(self, cell):
+        distance = self.rhs.get(cell, UNREACHABLE)
+        if distance == 0 or distance == UNREACHABLE:
+            return None
+
+        g = self.g
+        for offsets, targets in self.tables:
+            for index in range(offsets[cell], offsets[cell + 1]):
+                neighbor = targets[index]
+                if g.get(neighbor, UNREACHABLE) == distance - 1:
+                    return neighbor
+        return None
+
+    def next_step(self, start_location, target_location):
+        self.update(start_location, target_location)
+        cell = self.next_cell(self.start)
+        return self.maze.cell_location(cell) if cell is not None else None
+
+    def find_path(self, start_location, target_location):
+        self.update(start_location, target_location)
+        if self.rhs.get(self.start, UNREACHABLE) == UNREACHABLE:
+            return None
+
+        cells = [self.start]
+        next_cell = self.next_cell(self.start)
+        while next_cell is not None:
+            cells.append(next_cell)
+            next_cell = self.next_cell(next_cell)
+        return [self.maze.cell_location(cell) for cell in cells]
+
+def distance_field(maze, root_location, rule):
+    tables = maze.get_rule_tables(rule)
+    root = maze.cell_id(root_location)
+    distances = array('i', [-1]) * maze.size
+    distances[root] = 0
+    queue = deque([root])
+    expanded = 0
 
     while queue:
-        current_loc, path = queue.popleft()
-        current_pos = (current_loc.get_x(), current_loc.get_y())
-        if current_pos in visited:
-            continue
-        if (current_loc.get_x() == target_location.get_x() and
-                current_loc.get_y() == target_location.get_y()):
-            return path
+        current = queue.popleft()
+        expanded += 1
+        next_distance = distances[current] + 1
+
+        for offsets, targets in tables:
+            for index in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[index]
+                if distances[neighbor] < 0:
+                    distances[neighbor] = next_distance
+                    queue.append(neighbor)
+
+    record_search(expanded)
+    return distances
+
+def next_step_from_field(maze, distances, location, rule):
+    cell = maze.cell_id(location)
+    distance = distances[cell]
+    if distance <= 0:
+        return None
+
+    for neighbor in maze.get_neighbor_cells(cell, rule):
+        if distances[neighbor] == distance - 1:
+            return maze.cell_location(neighbor)
+
+    return None
+
+class PathCache:
+    def __init__(self, maze):
+        self.maze = maze
+        self.target_location = None
+        self.paths = {}
 
-        visited.add(current_pos)
+    def get_path(self, enemy, target_location):
+        if self.target_location != target_location:
+            self.target_location = target_location
+            self.paths = {}
 
-        for neighbor in maze.get_all_neighbors(current_loc):
-            neighbor_pos = (neighbor.get_x(), neighbor.get_y())
+        key = (type(enemy), enemy.search_algorithm, enemy.get_location())
 
-            if neighbor_pos not in visited:
-                new_path = path + [neighbor]
-                queue.append((neighbor, new_path))
+        if key not in self.paths:
+            self.paths[key] = enemy.find_shortest_path(self.maze, target_location)
+        return self.paths[key]
 
-    return None
\ No newline at end of file
+    def update(self, player, enemies):
+        return [self.get_path(enemy, player.get_location()) for enemy in enemies]
@@ -0,0 +1,208 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+from Character import Stormtrooper, DarthVader, KyloRen
+from maze import Maze, WALK
+from maze_generator import generate_map
+from pathfinding import SEARCH_ALGORITHMS
+
+
+ENEMY_CLASSES = [Stormtrooper, DarthVader, KyloRen]
+
+worker_maze = None
+
+
+class SerialPlanner:
+    def __init__(self, maze):
+        self.maze = maze
+        self.plan_seconds = 0.0
+
+    def plan(self, enemies, target_location):
+        start_time = time.perf_counter()
+        next_locations = [enemy.next_step(self.maze, target_location) for enemy in enemies]
+        self.plan_seconds += time.perf_counter() - start_time
+        return next_locations
+
+    def close(self):
+        pass
+
+
+def compile_tables(maze):
+    for enemy_class in ENEMY_CLASSES:
+        maze.get_rule_tables(enemy_class.movement_rule)
+
+
+def pygame_started():
+    pygame = sys.modules.get("pygame")
+    return pygame is not None and pygame.get_init()
+
+
+def init_worker(maze):
+    global worker_maze
+    worker_maze = maze
+
+
+def plan_chunk(tasks, target):
+    target_location = worker_maze.location(*target)
+    steps = []
+
+    for enemy_class, search_algorithm, x, y in tasks:
+        enemy = enemy_class(worker_maze.location(x, y))
+        enemy.search_algorithm = search_algorithm
+        next_location = enemy.next_step(worker_maze, target_location)
+        steps.append(None if next_location is None else (next_location.get_x(), next_location.get_y()))
+
+    return steps
+
+
+def portable_maze(maze):
+    return Maze.from_grid(maze.width, maze.height, bytearray(maze.grid), dict(maze.doors), maze.trophy_location,
+                          maze.player_start)
+
+
+class ParallelPlanner(SerialPlanner):
+    def __init__(self, maze, workers=None):
+        super().__init__(maze)
+        self.workers = workers or os.cpu_count() or 1
+
+        if multiprocessing.get_start_method() == "fork" and not pygame_started():
+            compile_tables(maze)
+            context = multiprocessing.get_context("fork")
+            shared_maze = maze
+        else:
+            context = multiprocessing.get_context("spawn")
+            shared_maze = portable_maze(maze)
+
+        self.executor = ProcessPoolExecutor(self.workers, mp_context=context, initializer=init_worker,
+                                            initargs=(shared_maze,))
+
+    def make_chunks(self, enemies):
+        chunks = {}
+        local = []
+
+        for index, enemy in enumerate(enemies):
+            if enemy.search_algorithm == "incremental":
+                local.append(index)
+            elif enemy.search_algorithm == "bfs":
+                chunks.setdefault((type(enemy), "bfs"), []).append(index)
+            else:
+                chunks.setdefault(index % self.workers, []).append(index)
+
+        return list(chunks.values()), local
+
+    def plan(self, enemies, target_location):
+        start_time = time.perf_counter()
+        chunks, local = self.make_chunks(enemies)
+        target = (target_location.get_x(), target_location.get_y())
+
+        futures = []
+        for chunk in chunks:
+            tasks = [(type(enemies[index]), enemies[index].search_algorithm, enemies[index].get_location().get_x(),
+                      enemies[index].get_location().get_y()) for index in chunk]
+            futures.append(self.executor.submit(plan_chunk, tasks, target))
+
+        next_locations = [None] * len(enemies)
+        for index in local:
+            next_locations[index] = enemies[index].next_step(self.maze, target_location)
+
+        for chunk, future in zip(chunks, futures):
+            for index, step in zip(chunk, future.result()):
+                next_locations[index] = None if step is None else self.maze.location(*step)
+
+        self.plan_seconds += time.perf_counter() - start_time
+        return next_locations
+
+    def close(self):
+        self.executor.shutdown()
+
+
+def create_planner(maze, workers=0):
+    if workers > 0:
+        return ParallelPlanner(maze, workers)
+    return SerialPlanner(maze)
+
+
+def chase_enemies(maze, enemy_count, search_algorithm, seed):
+    rng = random.Random(seed)
+    open_cells = [cell for cell in range(maze.size) if maze.grid[cell]]
+    enemies = []
+
+    for index in range(enemy_count):
+        enemy = ENEMY_CLASSES[index % len(ENEMY_CLASSES)](maze.cell_location(rng.choice(open_cells)))
+        enemy.search_algorithm = search_algorithm
+        enemies.append(enemy)
+
+    return enemies
+
+
+def run_chase(planner, maze, enemy_count, search_algorithm, turns, seed):
+    rng = random.Random(seed)
+    enemies = chase_enemies(maze, enemy_count, search_algorithm, seed)
+    player_location = maze.player_start
+    moves = []
+
+    for _ in range(turns):
+        neighbors = maze.get_move_neighbors(player_location, WALK)
+        if neighbors:
+            player_location = rng.choice(neighbors)
+
+        next_locations = planner.plan(enemies, player_location)
+        for enemy, next_location in zip(enemies, next_locations):
+            if next_location is not None:
+                enemy.set_location(next_location)
+
+        moves.append([(enemy.get_location().get_x(), enemy.get_location().get_y()) for enemy in enemies])
+
+    return moves
+
+
+def warm_up(planner, maze, enemy_count, search_algorithm, seed):
+    planner.plan(chase_enemies(maze, enemy_count, search_algorithm, seed), maze.player_start)
+    planner.plan_seconds = 0.0
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Düşman planlamasını seri ve paralel olarak karşılaştırır")
+    parser.add_argument("--size", type=parse_size, default=(301, 301))
+    parser.add_argument("--kind", default="braided")
+    parser.add_argument("--enemies", type=int, default=24)
+    parser.add_argument("--search", choices=sorted(SEARCH_ALGORITHMS), default="astar")
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    width, height = args.size
+    maze = generate_map(width, height, args.kind, args.seed).to_maze()
+    compile_tables(maze)
+
+    serial_planner = SerialPlanner(maze)
+    warm_up(serial_planner, maze, args.enemies, args.search, args.seed)
+    serial_moves = run_chase(serial_planner, maze, args.enemies, args.search, args.turns, args.seed)
+
+    maze.distance_tables.clear()
+    parallel_planner = ParallelPlanner(maze, args.workers)
+    try:
+        warm_up(parallel_planner, maze, args.enemies, args.search, args.seed)
+        parallel_moves = run_chase(parallel_planner, maze, args.enemies, args.search, args.turns, args.seed)
+    finally:
+        parallel_planner.close()
+
+    print(f"Seri: {serial_planner.plan_seconds:.2f} s, paralel ({args.workers} işçi): "
+          f"{parallel_planner.plan_seconds:.2f} s, hızlanma: "
+          f"{serial_planner.plan_seconds / parallel_planner.plan_seconds:.2f}x")
+    print("Hamleler aynı" if serial_moves == parallel_moves else "UYUMSUZ: paralel hamleler seri planlamadan farklı")
+
+
+if __name__ == "__main__":
+    main()
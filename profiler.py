@@ -0,0 +1,141 @@
+from collections import deque
+import json
+import os
+import time
+
+import pathfinding
+
+
+PROFILE_ENV = "STARWARS_PROFILE"
+TRACE_ENV = "STARWARS_PROFILE_TRACE"
+DEFAULT_TRACE_PATH = "profile_trace.json"
+
+WINDOW = 240
+MAX_TRACE_EVENTS = 200000
+
+PHASES = ["frame", "events", "turn", "draw_maze", "paths", "draw_characters", "display"]
+
+
+class Phase:
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, self.start, time.perf_counter())
+        return False
+
+
+class NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_PHASE = NullPhase()
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Profiler:
+    def __init__(self, enabled=False, trace_path=DEFAULT_TRACE_PATH):
+        self.enabled = enabled
+        self.trace_path = trace_path
+        self.origin = time.perf_counter()
+        self.samples = {}
+        self.expansions = deque(maxlen=WINDOW)
+        self.trace_events = []
+        self.dropped_events = 0
+        self.frame_start = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return NULL_PHASE
+        return Phase(self, name)
+
+    def record(self, name, start, end):
+        if name not in self.samples:
+            self.samples[name] = deque(maxlen=WINDOW)
+        self.samples[name].append(end - start)
+
+        if len(self.trace_events) < MAX_TRACE_EVENTS:
+            self.trace_events.append({
+                "name": name,
+                "ph": "X",
+                "ts": (start - self.origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": 0
+            })
+        else:
+            self.dropped_events += 1
+
+    def begin_frame(self):
+        if self.enabled:
+            pathfinding.reset_search_stats()
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self.frame_start is None:
+            return
+
+        end = time.perf_counter()
+        self.record("frame", self.frame_start, end)
+        self.frame_start = None
+
+        expanded = pathfinding.search_stats["expanded"]
+        self.expansions.append(expanded)
+        if len(self.trace_events) < MAX_TRACE_EVENTS:
+            self.trace_events.append({
+                "name": "expanded",
+                "ph": "C",
+                "ts": (end - self.origin) * 1e6,
+                "pid": os.getpid(),
+                "args": {"expanded": expanded}
+            })
+
+    def summary_lines(self):
+        lines = []
+        for name in PHASES:
+            values = self.samples.get(name)
+            if values:
+                lines.append(f"{name:15} p50 {percentile(values, 0.5) * 1000:6.2f} ms  "
+                             f"p99 {percentile(values, 0.99) * 1000:6.2f} ms")
+
+        if self.expansions:
+            lines.append(f"{'expanded':15} p50 {percentile(self.expansions, 0.5):6d}     "
+                         f"p99 {percentile(self.expansions, 0.99):6d}")
+        return lines
+
+    def write_trace(self):
+        if not self.enabled:
+            return
+
+        report = {
+            "traceEvents": self.trace_events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped_events}
+        }
+
+        with open(self.trace_path, 'w', encoding='utf-8') as file:
+            json.dump(report, file)
+
+        print(f"Profil izi yazıldı: {self.trace_path}")
+
+
+def create_profiler(enabled=False, trace_path=None):
+    if not enabled:
+        enabled = os.environ.get(PROFILE_ENV, "") not in ("", "0")
+    if trace_path is None:
+        trace_path = os.environ.get(TRACE_ENV, DEFAULT_TRACE_PATH)
+    return Profiler(enabled, trace_path)
@@ -0,0 +1,172 @@
+import argparse
+import hashlib
+import json
+import time
+
+from distance_table import grid_digest
+from game import GameState
+from map_loader import load_map
+
+
+REPLAY_VERSION = 2
+
+
+def map_hash(maze, character_types):
+    layout = {
+        "doors": {door: [location.get_x(), location.get_y()] for door, location in maze.doors.items()},
+        "trophy_location": [maze.trophy_location.get_x(), maze.trophy_location.get_y()],
+        "player_start": [maze.player_start.get_x(), maze.player_start.get_y()],
+        "characters": character_types
+    }
+
+    digest = hashlib.sha256(grid_digest(maze))
+    digest.update(json.dumps(layout, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def final_state(state):
+    return {
+        "turn": state.turn,
+        "lives": state.player.lives,
+        "game_over": state.game_over,
+        "victory": state.victory
+    }
+
+
+class ReplayRecorder:
+    def __init__(self, file_path):
+        self.file = open(file_path, 'w', encoding='utf-8')
+        self.session_start = None
+
+    def write(self, entry):
+        self.file.write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')))
+        self.file.write("\n")
+
+    def start_session(self, map_path, maze, character_types, character_name, seed):
+        self.session_start = time.perf_counter()
+        self.write({
+            "type": "session",
+            "version": REPLAY_VERSION,
+            "map": map_path,
+            "map_hash": map_hash(maze, character_types),
+            "characters": character_types,
+            "character": character_name,
+            "seed": seed
+        })
+
+    def elapsed_ms(self):
+        return int((time.perf_counter() - self.session_start) * 1000)
+
+    def record(self, action):
+        self.write({"type": "action", "t": self.elapsed_ms(), "action": action})
+
+    def end_session(self, state):
+        entry = {"type": "end", "t": self.elapsed_ms()}
+        entry.update(final_state(state))
+        self.write(entry)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def read_replay(file_path):
+    sessions = []
+
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            if not line.strip():
+                continue
+
+            entry = json.loads(line)
+            if entry["type"] == "session":
+                if entry["version"] != REPLAY_VERSION:
+                    raise ValueError(f"{file_path}:{line_number}: desteklenmeyen kayıt sürümü {entry['version']}")
+                entry["actions"] = []
+                entry["end"] = None
+                sessions.append(entry)
+            elif not sessions:
+                raise ValueError(f"{file_path}:{line_number}: oturum başlığından önce kayıt")
+            elif entry["type"] == "action":
+                sessions[-1]["actions"].append((entry["t"], entry["action"]))
+            elif entry["type"] == "end":
+                sessions[-1]["end"] = {key: value for key, value in entry.items() if key not in ("type", "t")}
+            else:
+                raise ValueError(f"{file_path}:{line_number}: bilinmeyen kayıt türü {entry['type']}")
+
+    return sessions
+
+
+def play_session(session, maze, character_types, on_step=None):
+    if map_hash(maze, character_types) != session["map_hash"]:
+        raise ValueError(f"Harita değişmiş: {session['map']} kayıttaki haritayla aynı değil")
+
+    state = GameState(maze, session["characters"], session["character"], seed=session["seed"])
+
+    for timestamp, action in session["actions"]:
+        if action == "reset":
+            state.reset()
+        else:
+            state.step(action)
+
+        if on_step is not None:
+            on_step(state, timestamp)
+
+    return state
+
+
+def render_session(session, maze, character_types):
+    import pygame
+    from ui import UI
+
+    ui = UI(maze)
+    start_time = time.perf_counter()
+
+    def draw(state, timestamp):
+        delay = timestamp / 1000 - (time.perf_counter() - start_time)
+        if delay > 0:
+            time.sleep(delay)
+        pygame.event.pump()
+
+        ui.draw_maze()
+        ui.draw_characters(state.player, state.enemies, state.get_enemy_paths())
+        ui.update_display()
+
+    return play_session(session, maze, character_types, draw)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kaydedilmiş oyunları tekrar oynatır")
+    parser.add_argument("replay")
+    parser.add_argument("--render", action="store_true", help="Kaydı gerçek hızda ekranda oynat")
+    parser.add_argument("--repeat", type=int, default=1, help="Başsız oynatmayı kaç kez tekrarla")
+    args = parser.parse_args()
+
+    sessions = read_replay(args.replay)
+    mismatches = 0
+    start_time = time.perf_counter()
+    actions = 0
+
+    repeats = 1 if args.render else args.repeat
+    for _ in range(repeats):
+        for session in sessions:
+            characters, maze = load_map(session["map"])
+            character_types = [char_type for char_type, _ in characters]
+            if args.render:
+                state = render_session(session, maze, character_types)
+            else:
+                state = play_session(session, maze, character_types)
+            actions += len(session["actions"])
+
+            if session["end"] is not None and final_state(state) != session["end"]:
+                mismatches += 1
+                print(f"UYUMSUZ: kayıt {session['end']}, tekrar {final_state(state)}")
+
+    elapsed = time.perf_counter() - start_time
+    print(f"{len(sessions)} oturum x {repeats}, {actions} hamle, {elapsed:.2f} s "
+          f"({actions / elapsed if elapsed else 0:.0f} hamle/s)")
+    print("Tekrar kayıtla uyumlu" if mismatches == 0 else f"{mismatches} oturum kayıttan farklı")
+
+
+if __name__ == "__main__":
+    main()
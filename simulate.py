@@ -0,0 +1,117 @@
+import argparse
+import random
+import time
+
+from distance_table import save_distance_tables
+from game import GameState, MOVES
+from map_loader import load_map
+from maze import WALK
+from pathfinding import SEARCH_ALGORITHMS, distance_field, next_step_from_field
+from planner import create_planner
+
+
+ACTIONS = list(MOVES.keys())
+
+SEARCH_CHOICES = sorted(SEARCH_ALGORITHMS) + ["incremental"]
+
+
+def random_policy(state, rng, trophy_field):
+    return rng.choice(ACTIONS)
+
+
+def trophy_policy(state, rng, trophy_field):
+    location = state.player.get_location()
+    next_location = next_step_from_field(state.maze, trophy_field, location, WALK)
+    if next_location is None:
+        return rng.choice(ACTIONS)
+
+    move = (next_location.get_x() - location.get_x(), next_location.get_y() - location.get_y())
+    for action, direction in MOVES.items():
+        if direction == move:
+            return action
+
+
+POLICIES = {
+    "random": random_policy,
+    "trophy": trophy_policy
+}
+
+
+def simulate_game(maze, character_types, character_name, seed, policy, max_steps, trophy_field,
+                  search_algorithm=None, planner=None):
+    state = GameState(maze, character_types, character_name, seed=seed, search_algorithm=search_algorithm,
+                      planner=planner)
+    policy_rng = random.Random(seed)
+    steps = 0
+
+    while not state.is_finished() and steps < max_steps:
+        state.step(policy(state, policy_rng, trophy_field))
+        steps += 1
+
+    if state.game_over:
+        outcome = "game_over"
+    elif state.victory:
+        outcome = "victory"
+    else:
+        outcome = "timeout"
+
+    return {
+        "seed": seed,
+        "outcome": outcome,
+        "turns": state.turn,
+        "lives": state.player.lives
+    }
+
+
+def run_batch(maze, character_types, character_name, games, first_seed=0, policy="trophy", max_steps=500,
+              search_algorithm=None, workers=0):
+    trophy_field = distance_field(maze, maze.trophy_location, WALK)
+    policy_function = POLICIES[policy]
+    planner = create_planner(maze, workers)
+
+    try:
+        return [
+            simulate_game(maze, character_types, character_name, seed, policy_function, max_steps, trophy_field,
+                          search_algorithm, planner)
+            for seed in range(first_seed, first_seed + games)
+        ]
+    finally:
+        planner.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Oyunları pencere açmadan toplu olarak simüle eder")
+    parser.add_argument("--map", default="Star wars harita.txt")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="trophy")
+    parser.add_argument("--character", choices=["Luke Skywalker", "Master Yoda"], default="Luke Skywalker")
+    parser.add_argument("--max-steps", type=int, default=500)
+    parser.add_argument("--search", choices=SEARCH_CHOICES, default=None)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    characters, maze = load_map(args.map)
+    character_types = [char_type for char_type, _ in characters]
+
+    start_time = time.perf_counter()
+    results = run_batch(maze, character_types, args.character, args.games, args.seed, args.policy, args.max_steps,
+                        args.search, args.workers)
+    elapsed = time.perf_counter() - start_time
+    save_distance_tables(maze)
+
+    outcomes = {"victory": 0, "game_over": 0, "timeout": 0}
+    for result in results:
+        outcomes[result["outcome"]] += 1
+
+    average_turns = sum(result["turns"] for result in results) / len(results) if results else 0
+
+    print(f"Oyun sayısı: {len(results)}")
+    for outcome, count in outcomes.items():
+        print(f"{outcome}: {count}")
+    print(f"Ortalama tur: {average_turns:.1f}")
+    print(f"Süre: {elapsed:.2f} s ({len(results) / elapsed:.0f} oyun/s)")
+
+
+if __name__ == "__main__":
+    main()
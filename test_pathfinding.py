@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from maze import Maze, WALK, DOUBLE_STEP
+from maze_generator import generate_map
+from pathfinding import astar, bfs_by_rule, bidirectional_bfs
+
+
+PAIRS_PER_MAZE = 40
+
+
+def random_grid_maze(width, height, wall_density, seed):
+    rng = random.Random(seed)
+    return Maze([[0 if rng.random() < wall_density else 1 for _ in range(width)] for _ in range(height)])
+
+
+MAZES = {
+    "perfect": lambda: generate_map(31, 21, "perfect", 1).to_maze(),
+    "braided": lambda: generate_map(41, 31, "braided", 2).to_maze(),
+    "arena": lambda: generate_map(25, 25, "arena", 3).to_maze(),
+    "open": lambda: random_grid_maze(20, 15, 0.0, 4),
+    "sparse": lambda: random_grid_maze(30, 20, 0.2, 5),
+    "dense": lambda: random_grid_maze(30, 20, 0.4, 6)
+}
+
+
+def path_length(path):
+    return None if path is None else len(path) - 1
+
+
+def sample_pairs(maze, seed):
+    rng = random.Random(seed)
+    open_cells = [cell for cell in range(maze.size) if maze.grid[cell]]
+    return [(maze.cell_location(rng.choice(open_cells)), maze.cell_location(rng.choice(open_cells)))
+            for _ in range(PAIRS_PER_MAZE)]
+
+
+@pytest.mark.parametrize("search", [astar, bidirectional_bfs])
+@pytest.mark.parametrize("rule", [WALK, DOUBLE_STEP])
+@pytest.mark.parametrize("maze_name", list(MAZES))
+def test_path_length_matches_bfs(search, rule, maze_name):
+    maze = MAZES[maze_name]()
+
+    for start_location, target_location in sample_pairs(maze, maze_name):
+        expected = path_length(bfs_by_rule(maze, start_location, target_location, rule))
+        assert path_length(search(maze, start_location, target_location, rule)) == expected, \
+            (maze_name, rule, start_location.get_x(), start_location.get_y(), target_location.get_x(),
+             target_location.get_y())
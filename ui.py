@@ -1,8 +1,11 @@
 import pygame
-import sys
+import assets
 from location import Location
 
 
+ATTRACT_INTERVAL = 500
+
+
 class UI:
     def __init__(self, maze, cell_size=50):
         self.maze = maze
@@ -27,8 +30,15 @@ class UI:
             "start_location": (255, 255, 0)
         }
 
-        self.font = pygame.font.SysFont('Arial', 32)
-        self.small_font = pygame.font.SysFont('Arial', 16)
+        self.font = assets.get_font('Arial', 32)
+        self.small_font = assets.get_font('Arial', 16)
+
+        self.background = None
+        self.background_key = None
+
+        self.full_update = True
+        self.dirty_rects = []
+        self.previous_dirty_rects = []
 
 
         self.load_images()
@@ -53,27 +63,37 @@ class UI:
             self.images = {}
 
     def load_and_scale_image(self, path, scale=1.0):
-        try:
-            image = pygame.image.load(path)
-            new_width = int(self.cell_size * scale)
-            new_height = int(self.cell_size * scale)
-            return pygame.transform.scale(image, (new_width, new_height))
-        except (pygame.error, FileNotFoundError):
-            print(f"Could not load image: {path}")
-            return None
+        new_width = int(self.cell_size * scale)
+        new_height = int(self.cell_size * scale)
+        return assets.get_scaled_image(path, (new_width, new_height))
 
     def load_sounds(self):
         self.sounds = {}
-        try:
-            self.sounds["caught"] = pygame.mixer.Sound("assets/caught.wav")
-            self.sounds["victory"] = pygame.mixer.Sound("assets/victory .wav")
-            self.sounds["game_over"] = pygame.mixer.Sound("assets/game over.wav")
-            self.sounds["background_music"] = pygame.mixer.Sound("assets/background_music.wav")
-        except (pygame.error, FileNotFoundError):
+        for name, path in [("caught", "assets/caught.wav"), ("victory", "assets/victory .wav"),
+                           ("game_over", "assets/game over.wav")]:
+            sound = assets.get_sound(path)
+            if sound is not None:
+                self.sounds[name] = sound
+
+        if len(self.sounds) < 3:
             print("Warning: Some sounds could not be loaded")
 
     def draw_maze(self):
-        self.screen.fill(self.colors["background"])
+        background_key = (id(self.maze), self.maze.width, self.maze.height, self.cell_size)
+        if self.background is None or self.background_key != background_key:
+            self.background = self.render_background()
+            self.background_key = background_key
+            self.full_update = True
+
+        if self.full_update:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous_dirty_rects:
+                self.screen.blit(self.background, rect, rect)
+
+    def render_background(self):
+        background = pygame.Surface((self.width, self.height))
+        background.fill(self.colors["background"])
 
         for y in range(self.maze.height):
             for x in range(self.maze.width):
@@ -85,8 +105,8 @@ class UI:
                 )
 
                 cell_type = "wall" if self.maze.data[y][x] == 0 else "path"
-                pygame.draw.rect(self.screen, self.colors[cell_type], rect)
-                pygame.draw.rect(self.screen, (100, 100, 100), rect, 1)
+                pygame.draw.rect(background, self.colors[cell_type], rect)
+                pygame.draw.rect(background, (100, 100, 100), rect, 1)
 
         for door_key, door_loc in self.maze.doors.items():
             x, y = door_loc.get_x(), door_loc.get_y()
@@ -97,17 +117,17 @@ class UI:
                 self.cell_size,
                 self.cell_size
             )
-            pygame.draw.rect(self.screen, self.colors["door"], door_rect, 3)
+            pygame.draw.rect(background, self.colors["door"], door_rect, 3)
 
-            text = self.small_font.render(door_key, True, self.colors["door"])
+            text = assets.render_text(self.small_font, door_key, self.colors["door"])
             text_rect = text.get_rect(center=(
                 x * self.cell_size + self.cell_size // 2,
                 y * self.cell_size + self.cell_size // 2
             ))
-            self.screen.blit(text, text_rect)
+            background.blit(text, text_rect)
 
             if "door" in self.images and self.images["door"]:
-                self.screen.blit(self.images["door"], door_rect)
+                background.blit(self.images["door"], door_rect)
 
 
         trophy_x, trophy_y = self.maze.trophy_location.get_x(), self.maze.trophy_location.get_y()
@@ -119,15 +139,15 @@ class UI:
         )
 
         if "trophy" in self.images and self.images["trophy"]:
-            self.screen.blit(self.images["trophy"], trophy_rect)
+            background.blit(self.images["trophy"], trophy_rect)
         else:
-            pygame.draw.rect(self.screen, self.colors["trophy"], trophy_rect)
-            text = self.small_font.render("🏆", True, (0, 0, 0))
+            pygame.draw.rect(background, self.colors["trophy"], trophy_rect)
+            text = assets.render_text(self.small_font, "🏆", (0, 0, 0))
             text_rect = text.get_rect(center=(
                 trophy_x * self.cell_size + self.cell_size // 2,
                 trophy_y * self.cell_size + self.cell_size // 2
             ))
-            self.screen.blit(text, text_rect)
+            background.blit(text, text_rect)
 
         start_x, start_y = self.maze.player_start.get_x(), self.maze.player_start.get_y()
         start_rect = pygame.Rect(
@@ -137,23 +157,26 @@ class UI:
             self.cell_size
         )
         if "start_location" in self.images and self.images["start_location"]:
-            self.screen.blit(self.images["start_location"], start_rect)
+            background.blit(self.images["start_location"], start_rect)
         else:
-            pygame.draw.rect(self.screen, self.colors["start_location"], start_rect)
-            text = self.small_font.render("", True, (0, 0, 0))
+            pygame.draw.rect(background, self.colors["start_location"], start_rect)
+            text = assets.render_text(self.small_font, "", (0, 0, 0))
             text_rect = text.get_rect(center=(
                 start_x * self.cell_size + self.cell_size // 2,
                 start_y * self.cell_size + self.cell_size // 2
             ))
-            self.screen.blit(text, text_rect)
+            background.blit(text, text_rect)
 
+        return background
 
     def draw_characters(self, player, enemies, paths=None):
+        if paths is None:
+            paths = [enemy.find_shortest_path(self.maze, player.get_location()) for enemy in enemies]
+
         enemy_paths = []
         enemy_distances = []
 
-        for enemy in enemies:
-            path = enemy.find_shortest_path(self.maze, player.get_location())
+        for path in paths:
             enemy_paths.append(path)
             if path:
                 enemy_distances.append(len(path) - 1)
@@ -165,6 +188,8 @@ class UI:
         else:
             nearest_enemy_index = -1
 
+        dirty_rects = []
+
         for i, path in enumerate(enemy_paths):
             if path:
                 for loc in path[1:]:
@@ -177,6 +202,7 @@ class UI:
 
                     if i == nearest_enemy_index:
                         pygame.draw.rect(self.screen, self.colors["nearest_enemy_path"], path_rect)
+                        dirty_rects.append(path_rect)
 
         player_x, player_y = player.get_location().get_x(), player.get_location().get_y()
         player_rect = pygame.Rect(
@@ -192,11 +218,13 @@ class UI:
         elif player.get_name() == "Master Yoda" and "yoda" in self.images:
             player_image = self.images["yoda"]
 
+        dirty_rects.append(player_rect)
+
         if player_image:
             self.screen.blit(player_image, player_rect)
         else:
             pygame.draw.rect(self.screen, self.colors["player"], player_rect)
-            text = self.small_font.render("P", True, (0, 0, 0))
+            text = assets.render_text(self.small_font, "P", (0, 0, 0))
             text_rect = text.get_rect(center=(
                 player_x * self.cell_size + self.cell_size // 2,
                 player_y * self.cell_size + self.cell_size // 2
@@ -220,6 +248,8 @@ class UI:
             elif enemy.get_name() == "Stormtrooper" and "trooper" in self.images:
                 enemy_image = self.images["trooper"]
 
+            dirty_rects.append(enemy_rect)
+
             if enemy_image:
                 self.screen.blit(enemy_image, enemy_rect)
             else:
@@ -229,35 +259,38 @@ class UI:
                     pygame.draw.rect(self.screen, self.colors["enemy"], enemy_rect)
 
                 initial = enemy.get_name()[0]
-                text = self.small_font.render(initial, True, (255, 255, 255))
+                text = assets.render_text(self.small_font, initial, (255, 255, 255))
                 text_rect = text.get_rect(center=(
                     enemy_x * self.cell_size + self.cell_size // 2,
                     enemy_y * self.cell_size + self.cell_size // 2
                 ))
                 self.screen.blit(text, text_rect)
 
-        self.draw_lives(player)
+        dirty_rects.extend(self.draw_lives(player))
+
+        self.dirty_rects = dirty_rects
 
     def draw_lives(self, player):
         heart_size = self.cell_size // 2
         lives = player.lives
 
-        lives_text = self.small_font.render(f"Can: {lives}", True, (255, 255, 255))
-        self.screen.blit(lives_text, (10, 10))
+        lives_text = assets.render_text(self.small_font, f"Can: {lives}", (255, 255, 255))
+        dirty_rects = [self.screen.blit(lives_text, (10, 10))]
 
         if "heart" in self.images and "half_heart" in self.images:
             full_hearts = int(lives)
             for i in range(full_hearts):
-                self.screen.blit(self.images["heart"], (10 + i * heart_size, 40))
+                dirty_rects.append(self.screen.blit(self.images["heart"], (10 + i * heart_size, 40)))
 
             if lives - full_hearts >= 0.5:
-                self.screen.blit(self.images["half_heart"], (10 + full_hearts * heart_size, 40))
+                dirty_rects.append(self.screen.blit(self.images["half_heart"], (10 + full_hearts * heart_size, 40)))
         else:
             life_width = 50
             life_height = 20
 
             life_border = pygame.Rect(10, 40, 3 * life_width, life_height)
             pygame.draw.rect(self.screen, (255, 255, 255), life_border, 2)
+            dirty_rects.append(life_border)
 
             if player.get_name() == "Luke Skywalker":
                 max_lives = 3.0
@@ -268,14 +301,40 @@ class UI:
             life_rect = pygame.Rect(10, 40, int(3 * life_width * life_percent), life_height)
             pygame.draw.rect(self.screen, (255, 0, 0), life_rect)
 
+        return dirty_rects
+
+    def draw_profile(self, lines):
+        line_height = self.small_font.get_linesize()
+        surfaces = [assets.render_text(self.small_font, line, (0, 255, 0)) for line in lines]
+        width = max((surface.get_width() for surface in surfaces), default=0) + 10
+
+        overlay_rect = pygame.Rect(self.width - width, 0, width, len(surfaces) * line_height + 10)
+        self.screen.fill((0, 0, 0), overlay_rect)
+        for index, surface in enumerate(surfaces):
+            self.screen.blit(surface, (overlay_rect.x + 5, 5 + index * line_height))
+
+        self.dirty_rects.append(overlay_rect)
+
+    def update_display(self):
+        if self.full_update:
+            pygame.display.flip()
+            self.full_update = False
+        else:
+            pygame.display.update(self.previous_dirty_rects + self.dirty_rects)
+
+        self.previous_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+
     def show_start_screen(self):
+        self.full_update = True
+
         self.screen.fill((0, 0, 0))
 
-        title = self.font.render("Star Wars Labirent", True, (255, 255, 0))
-        subtitle = self.small_font.render("Karakterinizi seçin:", True, (255, 255, 255))
+        title = assets.render_text(self.font, "Star Wars Labirent", (255, 255, 0))
+        subtitle = assets.render_text(self.small_font, "Karakterinizi seçin:", (255, 255, 255))
 
-        luke_text = self.font.render("1 - Luke Skywalker", True, (255, 255, 255))
-        yoda_text = self.font.render("2 - Master Yoda", True, (255, 255, 255))
+        luke_text = assets.render_text(self.font, "1 - Luke Skywalker", (255, 255, 255))
+        yoda_text = assets.render_text(self.font, "2 - Master Yoda", (255, 255, 255))
 
         title_rect = title.get_rect(center=(self.width // 2, self.height // 4))
         subtitle_rect = subtitle.get_rect(center=(self.width // 2, self.height // 3))
@@ -299,30 +358,37 @@ class UI:
 
         pygame.display.flip()
 
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_1:
-                        return "Luke Skywalker"
-                    elif event.key == pygame.K_2:
-                        return "Master Yoda"
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_pos = pygame.mouse.get_pos()
-                    if luke_rect.collidepoint(mouse_pos):
-                        return "Luke Skywalker"
-                    elif yoda_rect.collidepoint(mouse_pos):
-                        return "Master Yoda"
-
-    def show_game_over(self):
+        def blink_subtitle(frame):
+            if frame % 2:
+                self.screen.fill((0, 0, 0), subtitle_rect)
+            else:
+                self.screen.blit(subtitle, subtitle_rect)
+            return [subtitle_rect]
+
+        def choose_character(event):
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_1:
+                    return "Luke Skywalker"
+                elif event.key == pygame.K_2:
+                    return "Master Yoda"
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if luke_rect.collidepoint(event.pos):
+                    return "Luke Skywalker"
+                elif yoda_rect.collidepoint(event.pos):
+                    return "Master Yoda"
+            return None
+
+        return self.run_modal(choose_character, animate=blink_subtitle)
+
+    def show_game_over(self, timeout=None):
+        self.full_update = True
+
         overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        game_over_text = self.font.render("GAME OVER", True, (255, 0, 0))
-        instruction = self.small_font.render("Tekrar Oynamak için SPACE Tuşuna, Çıkmak İçin ESC, Menüye Dönmek için M Tuşuna Basınız", True,(255, 255, 255))
+        game_over_text = assets.render_text(self.font, "GAME OVER", (255, 0, 0))
+        instruction = assets.render_text(self.small_font, "Tekrar Oynamak için SPACE Tuşuna, Çıkmak İçin ESC, Menüye Dönmek için M Tuşuna Basınız", (255, 255, 255))
 
         game_over_rect = game_over_text.get_rect(center=(self.width // 2, self.height // 2))
         instruction_rect = instruction.get_rect(center=(self.width // 2, self.height // 2 + 50))
@@ -335,27 +401,18 @@ class UI:
 
         pygame.display.flip()
 
-        while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        return "play_again"
-                    elif event.key == pygame.K_ESCAPE:
-                        return "quit"
-                    elif event.key == pygame.K_m:
-                        return "menu"
-
-    def show_victory(self):
+        return self.run_modal(self.end_screen_action, timeout=timeout) or "menu"
+
+    def show_victory(self, timeout=None):
+        self.full_update = True
+
         overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
-        victory_text = self.font.render("VICTORY!", True, (255, 215, 0))
-        instruction = self.small_font.render("Press SPACE to play again, ESC to quit, or M to return to menu", True,
-                                             (255, 255, 255))
+        victory_text = assets.render_text(self.font, "VICTORY!", (255, 215, 0))
+        instruction = assets.render_text(self.small_font, "Press SPACE to play again, ESC to quit, or M to return to menu",
+                                         (255, 255, 255))
 
         victory_rect = victory_text.get_rect(center=(self.width // 2, self.height // 2))
         instruction_rect = instruction.get_rect(center=(self.width // 2, self.height // 2 + 50))
@@ -368,18 +425,57 @@ class UI:
             self.sounds["victory"].play()
 
         pygame.display.flip()
+
+        return self.run_modal(self.end_screen_action, timeout=timeout) or "menu"
+
+    def end_screen_action(self, event):
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_SPACE:
+                return "play_again"
+            elif event.key == pygame.K_ESCAPE:
+                return "quit"
+            elif event.key == pygame.K_m:
+                return "menu"
+        return None
+
+    def run_modal(self, handle_event, animate=None, timeout=None):
+        start_ticks = pygame.time.get_ticks()
+        next_frame = start_ticks + ATTRACT_INTERVAL
+        frame = 0
+
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        return "play_again"
-                    elif event.key == pygame.K_ESCAPE:
-                        return "quit"
-                    elif event.key == pygame.K_m:
-                        return "menu"
+            now = pygame.time.get_ticks()
+            if timeout is not None and now - start_ticks >= timeout:
+                return None
+
+            if animate is not None and now >= next_frame:
+                frame += 1
+                pygame.display.update(animate(frame))
+                next_frame = now + ATTRACT_INTERVAL
+
+            waits = []
+            if animate is not None:
+                waits.append(next_frame - now)
+            if timeout is not None:
+                waits.append(start_ticks + timeout - now)
+
+            if waits:
+                event = pygame.event.wait(max(1, min(waits)))
+            else:
+                event = pygame.event.wait()
+
+            if event.type == pygame.NOEVENT:
+                continue
+            if event.type == pygame.QUIT:
+                return "quit"
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                pygame.display.flip()
+                continue
+
+            result = handle_event(event)
+            if result is not None:
+                return result
+
     def play_caught_sound(self):
         if "caught" in self.sounds:
             self.sounds["caught"].play()
@@ -388,9 +484,9 @@ class UI:
         y_offset = 70
         for i, (enemy_name, distance) in enumerate(enemy_distances.items()):
             if distance is not None:
-                distance_text = self.small_font.render(
+                distance_text = assets.render_text(
+                    self.small_font,
                     f"{enemy_name}: {distance} adım uzaklıkta",
-                    True,
                     (255, 255, 255)
                 )
                 self.screen.blit(distance_text, (10, y_offset + i * 25))
\ No newline at end of file